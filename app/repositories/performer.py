@@ -1,6 +1,6 @@
 """Performer repository."""
 import uuid
-from typing import Optional, List
+from typing import Any, Optional, List
 from decimal import Decimal
 from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
@@ -352,3 +352,35 @@ class PerformerRepository(BaseRepository[Performer]):
         performer.preselection_score = Decimal("10.00")
         await self.session.commit()
         return performer
+
+    async def bulk_update(
+        self, updates: dict[uuid.UUID, dict[str, Any]]
+    ) -> list[Performer]:
+        """Update several performers with one load and one flush.
+
+        Unlike calling update() per performer, this loads all targets in a
+        single SELECT and writes every change in a single flush. The
+        instances are not refreshed afterwards, so server-side defaults and
+        onupdate values are not reloaded; refresh them if a caller needs those.
+
+        Args:
+            updates: Mapping of performer UUID to the fields to update
+
+        Returns:
+            Updated performer instances (missing IDs are skipped)
+        """
+        if not updates:
+            return []
+
+        result = await self.session.execute(
+            select(Performer).where(Performer.id.in_(updates.keys()))
+        )
+        performers = list(result.scalars().all())
+
+        for performer in performers:
+            for key, value in updates[performer.id].items():
+                if hasattr(performer, key):
+                    setattr(performer, key, value)
+
+        await self.session.flush()
+        return performers
@@ -114,12 +114,11 @@ class BattleResultsEncodingService:
                 status=BattleStatus.COMPLETED,
             )
 
-            # Update each performer's preselection score
-            for performer_id, score in scores.items():
-                await self.performer_repo.update(
-                    performer_id,
-                    preselection_score=score,
-                )
+            # Update all performers' preselection scores in one flush
+            await self.performer_repo.bulk_update({
+                performer_id: {"preselection_score": score}
+                for performer_id, score in scores.items()
+            })
 
         # Refresh battle to get updated state
         await self.session.refresh(battle)
@@ -210,26 +209,18 @@ class BattleResultsEncodingService:
             await self.battle_repo.update(battle.id, **update_fields)
 
             # Update performer pool stats
-            if is_draw:
-                # Both performers get +1 draw
-                for performer in battle.performers:
-                    await self.performer_repo.update(
-                        performer.id,
-                        pool_draws=(performer.pool_draws or 0) + 1,
-                    )
-            else:
-                # Winner gets +1 win, loser gets +1 loss
-                for performer in battle.performers:
-                    if performer.id == winner_id:
-                        await self.performer_repo.update(
-                            performer.id,
-                            pool_wins=(performer.pool_wins or 0) + 1,
-                        )
-                    else:
-                        await self.performer_repo.update(
-                            performer.id,
-                            pool_losses=(performer.pool_losses or 0) + 1,
-                        )
+            stats = {}
+            for performer in battle.performers:
+                if is_draw:
+                    # Both performers get +1 draw
+                    stats[performer.id] = {"pool_draws": (performer.pool_draws or 0) + 1}
+                elif performer.id == winner_id:
+                    # Winner gets +1 win
+                    stats[performer.id] = {"pool_wins": (performer.pool_wins or 0) + 1}
+                else:
+                    # Loser gets +1 loss
+                    stats[performer.id] = {"pool_losses": (performer.pool_losses or 0) + 1}
+            await self.performer_repo.bulk_update(stats)
 
         # Refresh battle to get updated state
         await self.session.refresh(battle)
@@ -13,6 +13,10 @@ from uuid import UUID
 from app.models.battle import Battle, BattlePhase, BattleStatus
 from app.validators.result import ValidationResult
 
+# Preselection score bounds (inclusive)
+PRESELECTION_SCORE_MIN = Decimal("0.0")
+PRESELECTION_SCORE_MAX = Decimal("10.0")
+
 
 def validate_preselection_scores(
     battle: Battle,
@@ -71,7 +75,7 @@ def validate_preselection_scores(
             continue
 
         # Check range
-        if not (Decimal("0.0") <= score <= Decimal("10.0")):
+        if not (PRESELECTION_SCORE_MIN <= score <= PRESELECTION_SCORE_MAX):
             errors.append(
                 f"Performer {performer_id}: score {score} out of range (0.0-10.0)"
             )
@@ -5,18 +5,22 @@ This ensures tests NEVER affect the development database (./data/battle_d.db).
 
 See: workbench/FEATURE_SPEC_2025-12-18_DATABASE-PURGE-BUG.md
 """
+import asyncio
 import uuid
 from datetime import date
 from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
+from app.config import settings
 from app.db.database import Base
 from app.models import TournamentPhase, TournamentStatus
 from app.models.dancer import Dancer
@@ -27,6 +31,8 @@ from app.repositories.dancer import DancerRepository
 from app.repositories.tournament import TournamentRepository
 from app.repositories.category import CategoryRepository
 from app.repositories.performer import PerformerRepository
+from app.repositories.battle import BattleRepository
+from app.services.email.provider import BaseEmailProvider
 
 # =============================================================================
 # TEST DATABASE ISOLATION
@@ -42,12 +48,28 @@ _test_engine = create_async_engine(
 )
 
 # Create test-specific session maker (internal)
+# While a test runs it is bound to the per-module connection (see
+# test_db_connection below), so session commits only release a SAVEPOINT.
 _test_session_maker = async_sessionmaker(
     _test_engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    join_transaction_mode="create_savepoint",
 )
 
+
+# The sqlite3 driver defers BEGIN until the first DML statement and does not
+# open a transaction for SAVEPOINT, so SQLAlchemy must emit BEGIN itself for
+# nested rollbacks to work (SQLAlchemy's documented pysqlite/aiosqlite recipe).
+@event.listens_for(_test_engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(_test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
 # =============================================================================
 # PUBLIC API - Import this in test files!
 # =============================================================================
@@ -57,27 +79,88 @@ _test_session_maker = async_sessionmaker(
 test_session_maker = _test_session_maker  # Public alias for test files
 
 
-@pytest_asyncio.fixture(scope="function", autouse=True)
-async def setup_test_database():
-    """Setup and teardown test database for each test.
+def session_cookie(response) -> str:
+    """Return the session cookie value set by a login response.
+
+    Use: from tests.conftest import session_cookie
+    """
+    return response.cookies[settings.SESSION_COOKIE_NAME]
 
-    Uses an in-memory SQLite database that is completely isolated
-    from the development database. Each test gets a fresh database.
 
-    IMPORTANT: This fixture NEVER touches ./data/battle_d.db
+async def _run_ddl(operation):
+    """Run a metadata operation (create_all/drop_all) in its own transaction."""
+    async with _test_engine.begin() as conn:
+        await conn.run_sync(operation)
+
+
+async def _begin_module_transaction():
+    """Open a connection and begin the outer transaction for a module."""
+    conn = await _test_engine.connect()
+    transaction = await conn.begin()
+    return conn, transaction
+
+
+@pytest.fixture(scope="session")
+def db_event_loop():
+    """Event loop for session- and module-scoped database fixtures.
+
+    pytest-asyncio 0.23 cannot share a module-scoped async fixture defined in
+    conftest.py across modules, so wider-scoped setup runs its coroutines here
+    with run_until_complete(). aiosqlite binds each call to the calling loop,
+    so the connection it opens is usable from every test's own loop.
     """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def _test_schema(db_event_loop):
+    """Create all tables in the in-memory test database once per session."""
     # Import all models to register them with Base.metadata
     import app.models  # noqa: F401
 
-    # Create all tables in the in-memory test database
-    async with _test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    db_event_loop.run_until_complete(_run_ddl(Base.metadata.create_all))
+    yield
+    db_event_loop.run_until_complete(_run_ddl(Base.metadata.drop_all))
+
+
+@pytest.fixture(scope="module")
+def test_db_connection(db_event_loop, _test_schema):
+    """Wrap each test module in a single transaction that is rolled back.
+
+    Binds the test session maker to one connection, so every session opened
+    by fixtures, services or routes joins this transaction. Module-scoped
+    fixtures may create shared read-only data here; it is visible to every
+    test in the module and discarded when the module finishes.
+    """
+    conn, transaction = db_event_loop.run_until_complete(
+        _begin_module_transaction()
+    )
+    _test_session_maker.configure(bind=conn)
+
+    yield conn
+
+    _test_session_maker.configure(bind=_test_engine)
+    db_event_loop.run_until_complete(transaction.rollback())
+    db_event_loop.run_until_complete(conn.close())
+
+
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def setup_test_database(test_db_connection):
+    """Isolate each test in a SAVEPOINT rolled back on teardown.
+
+    The schema is created once per session (see _test_schema); whatever a
+    test writes is undone afterwards, so each test still sees only the
+    module's shared data.
+
+    IMPORTANT: This fixture NEVER touches ./data/battle_d.db
+    """
+    savepoint = await test_db_connection.begin_nested()
 
     yield
 
-    # Drop all tables after test (in-memory DB is discarded anyway)
-    async with _test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    await savepoint.rollback()
 
 
 # =============================================================================
@@ -94,6 +177,77 @@ def async_session():
     return _test_session_maker
 
 
+# =============================================================================
+# EMAIL MOCK
+# =============================================================================
+# Use: from tests.conftest import MockEmailProvider (or the mock_email_provider
+# fixture) instead of defining a copy per test module.
+
+
+class MockEmailProvider(BaseEmailProvider):
+    """Mock email provider for testing.
+
+    Stores sent emails in memory instead of actually sending them.
+    """
+
+    def __init__(self):
+        self.sent_emails = []
+
+    async def send_magic_link(
+        self, to_email: str, magic_link: str, first_name: str
+    ) -> bool:
+        """Mock email sending - just store the email data."""
+        self.sent_emails.append(
+            {"to_email": to_email, "magic_link": magic_link, "first_name": first_name}
+        )
+        return True
+
+    def clear(self):
+        """Clear sent emails list in place."""
+        self.sent_emails.clear()
+
+
+@pytest.fixture
+def mock_email_provider():
+    """Create mock email provider for testing."""
+    return MockEmailProvider()
+
+
+# =============================================================================
+# REPOSITORY MOCKS
+# =============================================================================
+# Spec'd repository mocks are built once per session and reset before each
+# test. They are spec'd from instances so the ``session`` attribute set in
+# __init__ is part of the spec. Modules that configure their repository mocks
+# differently wrap these fixtures with their own battle_repo / performer_repo.
+
+
+@pytest.fixture(scope="session")
+def _battle_repo_mock():
+    """Session-wide AsyncMock spec'd from a BattleRepository instance."""
+    return AsyncMock(spec_set=BattleRepository(MagicMock()))
+
+
+@pytest.fixture(scope="session")
+def _performer_repo_mock():
+    """Session-wide AsyncMock spec'd from a PerformerRepository instance."""
+    return AsyncMock(spec_set=PerformerRepository(MagicMock()))
+
+
+@pytest.fixture
+def battle_repo(_battle_repo_mock):
+    """Mock battle repository, reset for this test."""
+    _battle_repo_mock.reset_mock(return_value=True, side_effect=True)
+    return _battle_repo_mock
+
+
+@pytest.fixture
+def performer_repo(_performer_repo_mock):
+    """Mock performer repository, reset for this test."""
+    _performer_repo_mock.reset_mock(return_value=True, side_effect=True)
+    return _performer_repo_mock
+
+
 # =============================================================================
 # FACTORY FIXTURES FOR INTEGRATION TESTS
 # =============================================================================
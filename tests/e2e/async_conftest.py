@@ -21,7 +21,7 @@ See: TESTING.md §Async E2E Tests (Session Sharing Pattern)
 """
 import pytest
 import pytest_asyncio
-from typing import AsyncGenerator, Callable
+from typing import AsyncGenerator
 from contextlib import asynccontextmanager
 from datetime import date
 from uuid import uuid4
@@ -32,48 +32,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.main import app
 # Use isolated test database - NEVER import test_session_maker from app.db.database!
 from app.db.database import get_db
-from tests.conftest import test_session_maker
-from app.repositories.user import UserRepository
+from tests.conftest import MockEmailProvider, test_session_maker
 from app.repositories.tournament import TournamentRepository
 from app.repositories.category import CategoryRepository
 from app.repositories.dancer import DancerRepository
 from app.repositories.performer import PerformerRepository
 from app.repositories.battle import BattleRepository
-from app.models.user import UserRole
 from app.models.tournament import TournamentPhase, TournamentStatus
 from app.models.battle import BattlePhase, BattleStatus, BattleOutcomeType
 from app.auth import magic_link_auth
-from app.config import settings
 from app.services.email.service import EmailService
-from app.services.email.provider import BaseEmailProvider
 from app.dependencies import get_email_service
 
 
-# =============================================================================
-# MOCK EMAIL PROVIDER
-# =============================================================================
-
-
-class MockEmailProvider(BaseEmailProvider):
-    """Mock email provider for async E2E tests."""
-
-    def __init__(self):
-        self.sent_emails = []
-
-    async def send_magic_link(
-        self, to_email: str, magic_link: str, first_name: str
-    ) -> bool:
-        self.sent_emails.append({
-            "to_email": to_email,
-            "magic_link": magic_link,
-            "first_name": first_name
-        })
-        return True
-
-    def clear(self):
-        self.sent_emails = []
-
-
 # =============================================================================
 # CORE SESSION FIXTURE
 # =============================================================================
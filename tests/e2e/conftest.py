@@ -9,8 +9,10 @@ This ensures tests NEVER affect the development database (./data/battle_d.db).
 See: TESTING.md §End-to-End Tests
 See: workbench/FEATURE_SPEC_2025-12-18_DATABASE-PURGE-BUG.md
 """
+import asyncio
+import inspect
+
 import pytest
-import pytest_asyncio
 from datetime import date
 from uuid import uuid4
 from fastapi.testclient import TestClient
@@ -19,52 +21,43 @@ from app.main import app
 from app.auth import magic_link_auth
 from app.config import settings
 from app.db.database import get_db
-from app.repositories.user import UserRepository
 from app.repositories.dancer import DancerRepository
 from app.repositories.tournament import TournamentRepository
 from app.repositories.category import CategoryRepository
 from app.repositories.performer import PerformerRepository
 from app.repositories.battle import BattleRepository
-from app.models.user import UserRole
+from app.models.user import User, UserRole
 from app.models.tournament import TournamentPhase, TournamentStatus
-from app.models.battle import Battle, BattlePhase, BattleStatus, BattleOutcomeType
+from app.models.battle import BattlePhase, BattleStatus, BattleOutcomeType
 from app.services.email.service import EmailService
-from app.services.email.provider import BaseEmailProvider
 from app.dependencies import get_email_service
 
 # Import the isolated test session maker from main conftest
-from tests.conftest import _test_session_maker
+from tests.conftest import _test_session_maker, session_cookie
+
+# uvloop ships with uvicorn[standard] but is not available on Windows
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
 
 
 # =============================================================================
-# EMAIL MOCK (Reused from test_crud_workflows.py)
+# EVENT LOOP POLICY
 # =============================================================================
 
 
-class MockEmailProvider(BaseEmailProvider):
-    """Mock email provider for testing."""
-
-    def __init__(self):
-        self.sent_emails = []
-
-    async def send_magic_link(
-        self, to_email: str, magic_link: str, first_name: str
-    ) -> bool:
-        """Mock email sending - just store the email data."""
-        self.sent_emails.append(
-            {"to_email": to_email, "magic_link": magic_link, "first_name": first_name}
-        )
-        return True
-
-    def clear(self):
-        """Clear sent emails list."""
-        self.sent_emails = []
-
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run E2E async fixtures and tests on uvloop when it is installed.
 
-@pytest.fixture
-def mock_email_provider():
-    """Create mock email provider for testing."""
-    return MockEmailProvider()
+    pytest-asyncio creates every test loop from this policy, so fixture
+    calls like create_e2e_tournament() dispatch through libuv.
+    Falls back to the default asyncio policy otherwise.
+    """
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 # =============================================================================
@@ -72,18 +65,40 @@ def mock_email_provider():
 # =============================================================================
 
 
-@pytest_asyncio.fixture(scope="function")
-async def e2e_test_users():
-    """Create test users for E2E tests (admin, staff, mc, judge)."""
+async def _create_e2e_test_users():
+    """Insert the admin, staff, mc and judge users used by E2E clients."""
     async with _test_session_maker() as session:
-        user_repo = UserRepository(session)
-        await user_repo.create_user("admin@e2e-test.com", "Admin User", UserRole.ADMIN)
-        await user_repo.create_user("staff@e2e-test.com", "Staff User", UserRole.STAFF)
-        await user_repo.create_user("mc@e2e-test.com", "MC User", UserRole.MC)
-        await user_repo.create_user("judge@e2e-test.com", "Judge User", UserRole.JUDGE)
+        # One flush for all rows instead of a flush + refresh per create_user()
+        session.add_all([
+            User(email="admin@e2e-test.com", first_name="Admin User", role=UserRole.ADMIN),
+            User(email="staff@e2e-test.com", first_name="Staff User", role=UserRole.STAFF),
+            User(email="mc@e2e-test.com", first_name="MC User", role=UserRole.MC),
+            User(email="judge@e2e-test.com", first_name="Judge User", role=UserRole.JUDGE),
+        ])
         await session.commit()
-    yield
-    # Cleanup handled by setup_test_database fixture in main conftest.py
+
+
+def _assert_outside_test_savepoint(conn, what: str) -> None:
+    """Fail if module-scoped seed data is being built inside a test.
+
+    A test's SAVEPOINT rollback would discard the rows while the module
+    fixture kept reporting them as seeded for the rest of the module.
+    """
+    assert not conn.in_nested_transaction(), (
+        f"{what} must be built by a module-scoped fixture, not from a "
+        "test body or request.getfixturevalue()"
+    )
+
+
+@pytest.fixture(scope="module")
+def e2e_test_users(db_event_loop, test_db_connection):
+    """Create test users for E2E tests (admin, staff, mc, judge).
+
+    Seeded once per module inside the module transaction. Changes a test
+    makes to these users are undone by its SAVEPOINT rollback.
+    """
+    _assert_outside_test_savepoint(test_db_connection, "e2e_test_users")
+    db_event_loop.run_until_complete(_create_e2e_test_users())
 
 
 # =============================================================================
@@ -106,12 +121,7 @@ def get_session_cookie(client: TestClient, email: str, role: str) -> str:
     """
     token = magic_link_auth.generate_token(email, role)
     response = client.get(f"/auth/verify?token={token}", follow_redirects=False)
-
-    set_cookie_header = response.headers.get("set-cookie", "")
-    cookie_name = settings.SESSION_COOKIE_NAME
-    cookie_start = set_cookie_header.find(f"{cookie_name}=") + len(f"{cookie_name}=")
-    cookie_end = set_cookie_header.find(";", cookie_start)
-    return set_cookie_header[cookie_start:cookie_end]
+    return session_cookie(response)
 
 
 # =============================================================================
@@ -119,14 +129,29 @@ def get_session_cookie(client: TestClient, email: str, role: str) -> str:
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def _e2e_session_client():
+    """TestClient shared by every E2E test in the session.
+
+    Entering the client runs the app lifespan and starts its portal thread,
+    so this happens once instead of once per test. Per-test state (cookies,
+    dependency overrides) is reset by e2e_client.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def e2e_client(mock_email_provider):
+def e2e_client(_e2e_session_client, mock_email_provider):
     """Base test client with mocked email service and isolated test database.
 
     IMPORTANT: This fixture overrides the database dependency to use the
     isolated in-memory test database, preventing any changes to the
     development database (./data/battle_d.db).
 
+    The underlying TestClient is shared across the session; its cookies are
+    cleared after each test so every test starts logged out.
+
     Note: Use authenticated client fixtures (admin_client, etc.) for most tests.
     """
 
@@ -148,9 +173,9 @@ def e2e_client(mock_email_provider):
     app.dependency_overrides[get_email_service] = get_mock_email_service
     app.dependency_overrides[get_db] = get_test_db
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield _e2e_session_client
 
+    _e2e_session_client.cookies.clear()
     app.dependency_overrides.clear()
     mock_email_provider.clear()
 
@@ -174,6 +199,32 @@ def admin_client(e2e_client, e2e_test_users):
     return e2e_client
 
 
+@pytest.fixture(scope="module")
+def _admin_page_cache():
+    """Responses fetched through admin_page, kept for one module."""
+    return {}
+
+
+@pytest.fixture
+def admin_page(admin_client, _admin_page_cache):
+    """Fetch a page as admin, reusing the response within the module.
+
+    Several tests inspect the same rendered page; only the first one pays
+    for the request. Use only for GETs of pages no test in the module
+    modifies.
+
+    Usage:
+        response = admin_page("/admin/users")
+    """
+
+    def _get(url: str):
+        if url not in _admin_page_cache:
+            _admin_page_cache[url] = admin_client.get(url)
+        return _admin_page_cache[url]
+
+    return _get
+
+
 @pytest.fixture
 def staff_client(e2e_client, e2e_test_users):
     """Test client authenticated as staff.
@@ -189,6 +240,31 @@ def staff_client(e2e_client, e2e_test_users):
     return e2e_client
 
 
+@pytest.fixture(scope="module")
+def _staff_page_cache():
+    """Responses fetched through staff_page, kept for one module."""
+    return {}
+
+
+@pytest.fixture
+def staff_page(staff_client, _staff_page_cache):
+    """Fetch a page as staff, reusing the response within the module.
+
+    Staff counterpart of admin_page, for pages whose markup depends on the
+    user's role. Use only for GETs of pages no test in the module modifies.
+
+    Usage:
+        response = staff_page("/tournaments")
+    """
+
+    def _get(url: str):
+        if url not in _staff_page_cache:
+            _staff_page_cache[url] = staff_client.get(url)
+        return _staff_page_cache[url]
+
+    return _get
+
+
 @pytest.fixture
 def mc_client(e2e_client, e2e_test_users):
     """Test client authenticated as MC.
@@ -219,6 +295,99 @@ def judge_client(e2e_client, e2e_test_users):
 # =============================================================================
 
 
+async def _create_e2e_tournament(
+    name: str = None,
+    phase: TournamentPhase = TournamentPhase.REGISTRATION,
+    status: TournamentStatus = TournamentStatus.CREATED,
+    num_categories: int = 1,
+    performers_per_category: int = 4,
+):
+    """Create tournament with optional pre-populated data.
+
+    Shared by the create_e2e_tournament factory and the module-scoped
+    shared tournament fixtures.
+
+    Args:
+        name: Tournament name (auto-generated if None)
+        phase: Tournament phase
+        status: Tournament status
+        num_categories: Number of categories to create
+        performers_per_category: Performers per category
+
+    Returns:
+        Dict with tournament, categories, dancers, performers
+    """
+    async with _test_session_maker() as session:
+        # Create tournament
+        tournament_repo = TournamentRepository(session)
+        tournament = await tournament_repo.create_tournament(
+            name=name or f"E2E Tournament {uuid4().hex[:8]}"
+        )
+
+        # Update phase/status if different from defaults
+        updates = {}
+        if phase != TournamentPhase.REGISTRATION:
+            updates["phase"] = phase
+        if status != TournamentStatus.CREATED:
+            updates["status"] = status
+
+        if updates:
+            await tournament_repo.update(tournament.id, **updates)
+            tournament = await tournament_repo.get_by_id(tournament.id)
+
+        # Create categories
+        category_repo = CategoryRepository(session)
+        categories = []
+        for i in range(num_categories):
+            category = await category_repo.create_category(
+                tournament_id=tournament.id,
+                name=f"Category {i + 1}",
+                is_duo=False,
+                groups_ideal=2,
+                performers_ideal=4,
+            )
+            categories.append(category)
+
+        # Create dancers and performers
+        dancer_repo = DancerRepository(session)
+        performer_repo = PerformerRepository(session)
+        dancers = []
+        performers = []
+
+        for category in categories:
+            for j in range(performers_per_category):
+                dancer = await dancer_repo.create_dancer(
+                    email=f"dancer_{uuid4().hex[:8]}@test.com",
+                    first_name="Dancer",
+                    last_name=f"{j + 1}",
+                    date_of_birth=date(2000, 1, 1),
+                    blaze=f"B-Boy {uuid4().hex[:6]}",
+                )
+                dancers.append(dancer)
+
+                performer = await performer_repo.create_performer(
+                    tournament_id=tournament.id,
+                    category_id=category.id,
+                    dancer_id=dancer.id,
+                )
+                performers.append(performer)
+
+        await session.commit()
+
+        # Re-fetch to get committed state
+        tournament = await tournament_repo.get_by_id(tournament.id)
+
+        return {
+            "tournament": tournament,
+            "categories": categories,
+            "dancers": dancers,
+            "performers": performers,
+        }
+
+
+_E2E_TOURNAMENT_SIGNATURE = inspect.signature(_create_e2e_tournament)
+
+
 @pytest.fixture
 def create_e2e_tournament():
     """Factory to create tournament with categories and performers.
@@ -230,94 +399,73 @@ def create_e2e_tournament():
         data = await create_e2e_tournament(phase=TournamentPhase.PRESELECTION)
         data = await create_e2e_tournament(num_categories=2, performers_per_category=8)
     """
+    return _create_e2e_tournament
 
-    async def _create(
-        name: str = None,
-        phase: TournamentPhase = TournamentPhase.REGISTRATION,
-        status: TournamentStatus = TournamentStatus.CREATED,
-        num_categories: int = 1,
-        performers_per_category: int = 4,
-    ):
-        """Create tournament with optional pre-populated data.
 
-        Args:
-            name: Tournament name (auto-generated if None)
-            phase: Tournament phase
-            status: Tournament status
-            num_categories: Number of categories to create
-            performers_per_category: Performers per category
+@pytest.fixture
+def make_tournament(db_event_loop):
+    """Synchronous create_e2e_tournament for sync tests.
 
-        Returns:
-            Dict with tournament, categories, dancers, performers
-        """
-        async with _test_session_maker() as session:
-            # Create tournament
-            tournament_repo = TournamentRepository(session)
-            tournament = await tournament_repo.create_tournament(
-                name=name or f"E2E Tournament {uuid4().hex[:8]}"
+    Runs the factory on the shared db_event_loop instead of looking up
+    (or creating) a loop with asyncio.get_event_loop() in every test.
+
+    Usage:
+        data = make_tournament()
+        data = make_tournament(num_categories=2, performers_per_category=0)
+    """
+
+    def _make(**kwargs):
+        return db_event_loop.run_until_complete(_create_e2e_tournament(**kwargs))
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def shared_e2e_tournament_factory(db_event_loop, test_db_connection):
+    """Memoized create_e2e_tournament for module-scoped fixtures.
+
+    Tournaments are cached per module by their creation arguments (defaults
+    applied), so fixtures asking for the same shape share one build.
+
+    Only call this from module-scoped fixtures: data built inside a test is
+    rolled back with the test's SAVEPOINT and must not be cached, so such a
+    call fails.
+
+    Usage:
+        data = shared_e2e_tournament_factory(num_categories=2)
+    """
+    cache = {}
+
+    def _get(**kwargs):
+        bound = _E2E_TOURNAMENT_SIGNATURE.bind(**kwargs)
+        bound.apply_defaults()
+        key = tuple(bound.arguments.items())
+        if key not in cache:
+            _assert_outside_test_savepoint(
+                test_db_connection, "shared_e2e_tournament_factory tournaments"
             )
+            cache[key] = db_event_loop.run_until_complete(
+                _create_e2e_tournament(**kwargs)
+            )
+        return cache[key]
 
-            # Update phase/status if different from defaults
-            updates = {}
-            if phase != TournamentPhase.REGISTRATION:
-                updates["phase"] = phase
-            if status != TournamentStatus.CREATED:
-                updates["status"] = status
-
-            if updates:
-                await tournament_repo.update(tournament.id, **updates)
-                tournament = await tournament_repo.get_by_id(tournament.id)
-
-            # Create categories
-            category_repo = CategoryRepository(session)
-            categories = []
-            for i in range(num_categories):
-                category = await category_repo.create_category(
-                    tournament_id=tournament.id,
-                    name=f"Category {i + 1}",
-                    is_duo=False,
-                    groups_ideal=2,
-                    performers_ideal=4,
-                )
-                categories.append(category)
-
-            # Create dancers and performers
-            dancer_repo = DancerRepository(session)
-            performer_repo = PerformerRepository(session)
-            dancers = []
-            performers = []
-
-            for category in categories:
-                for j in range(performers_per_category):
-                    dancer = await dancer_repo.create_dancer(
-                        email=f"dancer_{uuid4().hex[:8]}@test.com",
-                        first_name="Dancer",
-                        last_name=f"{j + 1}",
-                        date_of_birth=date(2000, 1, 1),
-                        blaze=f"B-Boy {uuid4().hex[:6]}",
-                    )
-                    dancers.append(dancer)
-
-                    performer = await performer_repo.create_performer(
-                        tournament_id=tournament.id,
-                        category_id=category.id,
-                        dancer_id=dancer.id,
-                    )
-                    performers.append(performer)
+    return _get
 
-            await session.commit()
 
-            # Re-fetch to get committed state
-            tournament = await tournament_repo.get_by_id(tournament.id)
+@pytest.fixture(scope="module")
+def shared_e2e_tournament(shared_e2e_tournament_factory):
+    """Tournament with 1 category and 4 performers, shared by a module.
 
-            return {
-                "tournament": tournament,
-                "categories": categories,
-                "dancers": dancers,
-                "performers": performers,
-            }
+    Built once per module inside the module transaction. Tests may mutate
+    it: their changes are rolled back with the test's SAVEPOINT.
+    """
+    return shared_e2e_tournament_factory()
 
-    return _create
+
+@pytest.fixture(scope="module")
+def shared_tournament_with_2_categories(shared_e2e_tournament_factory):
+    """Tournament with 2 categories, shared by a module."""
+    return shared_e2e_tournament_factory(num_categories=2)
 
 
 @pytest.fixture
@@ -3,15 +3,11 @@
 Tests admin user management through HTTP interface.
 Target: Improve coverage from 35% to 80%+
 """
-import pytest
 from uuid import uuid4
 
 from tests.e2e import (
-    is_partial_html,
-    htmx_headers,
     assert_status_ok,
     assert_redirect,
-    assert_contains_text,
 )
 
 
@@ -729,7 +725,7 @@ class TestFixActiveTournaments:
         assert response.status_code == 303
         assert "/tournaments" in response.headers.get("location", "")
 
-    def test_fix_active_missing_selection(self, admin_client, create_e2e_tournament):
+    def test_fix_active_missing_selection(self, admin_client, make_tournament):
         """POST /admin/tournaments/fix-active without selection.
 
         Validates: DOMAIN_MODEL.md Tournament entity (single active constraint)
@@ -739,15 +735,9 @@ class TestFixActiveTournaments:
             When I POST to /admin/tournaments/fix-active without selecting which to keep
             Then I am redirected (303) with an error or info message
         """
-        import asyncio
-
         # Given - Create multiple active tournaments
-        asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament()
-        )
-        asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament()
-        )
+        make_tournament(num_categories=0, performers_per_category=0)
+        make_tournament(num_categories=0, performers_per_category=0)
 
         # When
         response = admin_client.post(
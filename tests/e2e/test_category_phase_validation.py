@@ -3,14 +3,9 @@
 Tests that categories can only be created when tournament status is CREATED.
 See: FEATURE_SPEC_2025-12-24_CATEGORY-CREATION-PHASE-VALIDATION.md
 """
-import pytest
-import pytest_asyncio
-
 from app.models.tournament import TournamentPhase, TournamentStatus
 from tests.e2e import (
     assert_status_ok,
-    assert_redirect,
-    assert_contains_text,
 )
 
 
@@ -18,7 +13,7 @@ class TestCategoryCreationStatusValidation:
     """Test BR-CAT-001: Category creation status restriction."""
 
     def test_create_category_allowed_when_created(
-        self, staff_client, create_e2e_tournament
+        self, staff_client, make_tournament
     ):
         """Category creation succeeds when tournament status is CREATED.
 
@@ -31,16 +26,12 @@ class TestCategoryCreationStatusValidation:
             And I should see a success message
         """
         # Given - create tournament via fixture
-        import asyncio
-
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(
-                name="Category Test CREATED",
-                status=TournamentStatus.CREATED,
-                phase=TournamentPhase.REGISTRATION,
-                num_categories=0,
-                performers_per_category=0,
-            )
+        data = make_tournament(
+            name="Category Test CREATED",
+            status=TournamentStatus.CREATED,
+            phase=TournamentPhase.REGISTRATION,
+            num_categories=0,
+            performers_per_category=0,
         )
         tournament_id = data["tournament"].id
 
@@ -61,7 +52,7 @@ class TestCategoryCreationStatusValidation:
         assert "Test Category" in response.text
 
     def test_create_category_blocked_when_active(
-        self, staff_client, create_e2e_tournament
+        self, staff_client, make_tournament
     ):
         """Category creation fails when tournament status is ACTIVE.
 
@@ -74,16 +65,12 @@ class TestCategoryCreationStatusValidation:
             And I should see an error message "Categories can only be added when tournament is in CREATED status"
         """
         # Given
-        import asyncio
-
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(
-                name="Category Test ACTIVE",
-                status=TournamentStatus.ACTIVE,
-                phase=TournamentPhase.PRESELECTION,
-                num_categories=1,
-                performers_per_category=5,
-            )
+        data = make_tournament(
+            name="Category Test ACTIVE",
+            status=TournamentStatus.ACTIVE,
+            phase=TournamentPhase.PRESELECTION,
+            num_categories=1,
+            performers_per_category=5,
         )
         tournament_id = data["tournament"].id
 
@@ -105,7 +92,7 @@ class TestCategoryCreationStatusValidation:
         assert "Blocked Category" not in response.text
 
     def test_create_category_blocked_when_completed(
-        self, staff_client, create_e2e_tournament
+        self, staff_client, make_tournament
     ):
         """Category creation fails when tournament status is COMPLETED.
 
@@ -117,16 +104,12 @@ class TestCategoryCreationStatusValidation:
             And I should see an error message "Categories can only be added when tournament is in CREATED status"
         """
         # Given
-        import asyncio
-
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(
-                name="Category Test COMPLETED",
-                status=TournamentStatus.COMPLETED,
-                phase=TournamentPhase.COMPLETED,
-                num_categories=1,
-                performers_per_category=5,
-            )
+        data = make_tournament(
+            name="Category Test COMPLETED",
+            status=TournamentStatus.COMPLETED,
+            phase=TournamentPhase.COMPLETED,
+            num_categories=1,
+            performers_per_category=5,
         )
         tournament_id = data["tournament"].id
 
@@ -148,7 +131,7 @@ class TestCategoryCreationStatusValidation:
         assert "Blocked Category" not in response.text
 
     def test_add_category_form_blocked_when_active(
-        self, staff_client, create_e2e_tournament
+        self, staff_client, make_tournament
     ):
         """Add category form redirects when tournament is ACTIVE.
 
@@ -160,16 +143,12 @@ class TestCategoryCreationStatusValidation:
             And I should see an error message
         """
         # Given
-        import asyncio
-
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(
-                name="Form Test ACTIVE",
-                status=TournamentStatus.ACTIVE,
-                phase=TournamentPhase.PRESELECTION,
-                num_categories=1,
-                performers_per_category=5,
-            )
+        data = make_tournament(
+            name="Form Test ACTIVE",
+            status=TournamentStatus.ACTIVE,
+            phase=TournamentPhase.PRESELECTION,
+            num_categories=1,
+            performers_per_category=5,
         )
         tournament_id = data["tournament"].id
 
@@ -184,7 +163,7 @@ class TestCategoryCreationStatusValidation:
         assert "Categories can only be added when tournament is in CREATED status" in response.text
 
     def test_add_category_button_hidden_when_active(
-        self, staff_client, create_e2e_tournament
+        self, staff_client, make_tournament
     ):
         """Add Category button not shown for ACTIVE tournaments.
 
@@ -195,16 +174,12 @@ class TestCategoryCreationStatusValidation:
             Then the "Add Category" button should not be visible
         """
         # Given
-        import asyncio
-
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(
-                name="Button Test ACTIVE",
-                status=TournamentStatus.ACTIVE,
-                phase=TournamentPhase.PRESELECTION,
-                num_categories=1,
-                performers_per_category=5,
-            )
+        data = make_tournament(
+            name="Button Test ACTIVE",
+            status=TournamentStatus.ACTIVE,
+            phase=TournamentPhase.PRESELECTION,
+            num_categories=1,
+            performers_per_category=5,
         )
         tournament_id = data["tournament"].id
 
@@ -218,7 +193,7 @@ class TestCategoryCreationStatusValidation:
         assert f"/tournaments/{tournament_id}/add-category" not in response.text
 
     def test_add_category_button_visible_when_created(
-        self, staff_client, create_e2e_tournament
+        self, staff_client, make_tournament
     ):
         """Add Category button shown for CREATED tournaments.
 
@@ -229,16 +204,12 @@ class TestCategoryCreationStatusValidation:
             Then the "Add Category" button should be visible
         """
         # Given
-        import asyncio
-
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(
-                name="Button Test CREATED",
-                status=TournamentStatus.CREATED,
-                phase=TournamentPhase.REGISTRATION,
-                num_categories=0,
-                performers_per_category=0,
-            )
+        data = make_tournament(
+            name="Button Test CREATED",
+            status=TournamentStatus.CREATED,
+            phase=TournamentPhase.REGISTRATION,
+            num_categories=0,
+            performers_per_category=0,
         )
         tournament_id = data["tournament"].id
 
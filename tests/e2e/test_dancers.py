@@ -3,7 +3,6 @@
 Tests dancer management through HTTP interface.
 Target: Improve coverage from 39% to 80%+
 """
-import pytest
 from uuid import uuid4
 
 from tests.e2e import (
@@ -226,7 +225,7 @@ class TestDancerProfile:
         # Then
         assert response.status_code == 404
 
-    def test_profile_loads(self, staff_client, create_e2e_tournament):
+    def test_profile_loads(self, staff_client, make_tournament):
         """GET /dancers/{id}/profile loads with valid dancer.
 
         Validates: DOMAIN_MODEL.md Dancer entity access
@@ -236,12 +235,8 @@ class TestDancerProfile:
             When I navigate to /dancers/{id}/profile
             Then the page loads successfully (200)
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(performers_per_category=1)
-        )
+        data = make_tournament(performers_per_category=1)
         dancer = data["dancers"][0]
 
         # When
@@ -307,7 +302,7 @@ class TestDancerEdit:
         # Then
         assert response.status_code == 404
 
-    def test_edit_form_loads(self, staff_client, create_e2e_tournament):
+    def test_edit_form_loads(self, staff_client, make_tournament):
         """GET /dancers/{id}/edit loads with valid dancer.
 
         Validates: DOMAIN_MODEL.md Dancer entity editing
@@ -317,12 +312,8 @@ class TestDancerEdit:
             When I navigate to /dancers/{id}/edit
             Then the page loads successfully (200)
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(performers_per_category=1)
-        )
+        data = make_tournament(performers_per_category=1)
         dancer = data["dancers"][0]
 
         # When
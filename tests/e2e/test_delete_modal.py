@@ -11,11 +11,23 @@ Scenarios from feature-spec.md:
   - No inline styles on buttons or form
   - Delete button uses class="btn btn-danger" (SCSS design system)
 """
-import pytest
 import re
 
 from tests.e2e import assert_status_ok
 
+# Delete form with inline style (old pattern: style="display: inline;")
+FORM_INLINE_STYLE_RE = re.compile(
+    r'<form[^>]*method="POST"[^>]*action="[^"]*delete[^"]*"[^>]*style=', re.IGNORECASE
+)
+# Button with inline background-color (old pattern: style="background-color: ...")
+BUTTON_INLINE_BG_RE = re.compile(r'<button[^>]*style="[^"]*background-color[^"]*"', re.IGNORECASE)
+# Cancel button (attributes may appear in different order)
+CANCEL_BUTTON_RE = re.compile(r'<button[^>]*type="button"[^>]*class="btn btn-secondary"')
+# Cancel button outside the form (old pattern: <button ...>Cancel</button><form...>)
+CANCEL_OUTSIDE_FORM_RE = re.compile(r'<button[^>]*class="btn btn-secondary"[^>]*>[^<]*</button>\s*<form')
+# modal-warning element with inline style
+WARNING_INLINE_STYLE_RE = re.compile(r'class="modal-warning"[^>]*style=')
+
 
 class TestDeleteModalButtonLayout:
     """Tests for delete modal button layout (BR-UI-001, BR-UX-001)."""
@@ -60,8 +72,7 @@ class TestDeleteModalButtonLayout:
 
         # Extract the delete modal form - look for form with delete action
         # Should NOT have style="display: inline;" pattern
-        form_inline_pattern = r'<form[^>]*method="POST"[^>]*action="[^"]*delete[^"]*"[^>]*style='
-        match = re.search(form_inline_pattern, response.text, re.IGNORECASE)
+        match = FORM_INLINE_STYLE_RE.search(response.text)
         assert match is None, "Delete form should not have inline styles"
 
     def test_delete_modal_no_inline_styles_on_buttons(self, admin_client):
@@ -84,8 +95,7 @@ class TestDeleteModalButtonLayout:
 
         # Should NOT have buttons with inline background-color styles
         # The old broken pattern: style="background-color: var(--pico-color-red-500);"
-        button_inline_pattern = r'<button[^>]*style="[^"]*background-color[^"]*"'
-        match = re.search(button_inline_pattern, response.text, re.IGNORECASE)
+        match = BUTTON_INLINE_BG_RE.search(response.text)
         assert match is None, "Buttons should not have inline background-color styles"
 
     def test_delete_modal_uses_btn_danger_class(self, admin_client):
@@ -130,8 +140,7 @@ class TestDeleteModalButtonLayout:
 
         # Cancel button should be type="button" class="btn btn-secondary"
         # Pattern allows for attributes in different order
-        cancel_pattern = r'<button[^>]*type="button"[^>]*class="btn btn-secondary"'
-        match = re.search(cancel_pattern, response.text)
+        match = CANCEL_BUTTON_RE.search(response.text)
         assert match is not None, "Cancel button should have type='button' class='btn btn-secondary'"
 
     def test_delete_modal_buttons_inside_form(self, admin_client):
@@ -163,8 +172,7 @@ class TestDeleteModalButtonLayout:
         # New pattern has: <form><button...>
 
         # Look for the broken pattern (cancel button outside form)
-        broken_pattern = r'<button[^>]*class="btn btn-secondary"[^>]*>[^<]*</button>\s*<form'
-        broken_match = re.search(broken_pattern, response.text)
+        broken_match = CANCEL_OUTSIDE_FORM_RE.search(response.text)
         assert broken_match is None, "Cancel button should not be outside the form"
 
         # Verify modal-footer is present (indicates new structure)
@@ -193,8 +201,7 @@ class TestDeleteModalWarningText:
 
         # Old pattern: class="warning-text" ... style="color: var(--pico-color-red-500);"
         # New pattern: class="modal-warning" (no inline style)
-        warning_inline_pattern = r'class="modal-warning"[^>]*style='
-        match = re.search(warning_inline_pattern, response.text)
+        match = WARNING_INLINE_STYLE_RE.search(response.text)
         assert match is None, "modal-warning should not have inline styles"
 
     def test_muted_text_uses_text_muted_class(self, admin_client):
@@ -6,17 +6,8 @@ See: FEATURE_SPEC_2025-12-08_E2E-TESTING-FRAMEWORK.md §3.1
 Note: Tests that require pre-created tournaments use HTTP endpoints to create data
 since direct database access is isolated from the TestClient's database context.
 """
-import pytest
 from uuid import uuid4
 
-from tests.e2e import (
-    is_partial_html,
-    htmx_headers,
-    assert_status_ok,
-    assert_redirect,
-    assert_unauthorized,
-)
-
 
 class TestBattleListAccess:
     """Test battle list page access.
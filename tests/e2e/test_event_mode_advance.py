@@ -11,10 +11,6 @@ import pytest
 from uuid import uuid4
 
 from tests.e2e import (
-    assert_status_ok,
-    assert_redirect,
-    assert_unauthorized,
-    assert_not_found,
     htmx_headers,
 )
 
@@ -5,7 +5,6 @@ See: FEATURE_SPEC_2025-12-08_E2E-TESTING-FRAMEWORK.md §4.3
 
 Note: Tests focus on HTMX response patterns without requiring pre-created data.
 """
-import pytest
 from uuid import uuid4
 
 from tests.e2e import (
@@ -5,7 +5,6 @@ Ensures the same minimum value is shown across all screens.
 
 See: FEATURE_SPEC_2025-12-17_MINIMUM-PERFORMER-FORMULA-INCONSISTENCY.md
 """
-import pytest
 import re
 
 from tests.e2e import (
@@ -13,6 +12,9 @@ from tests.e2e import (
     assert_contains_text,
 )
 
+# Tournament ID from a /tournaments/{id}/... URL
+TOURNAMENT_ID_RE = re.compile(r"/tournaments/([^/]+)")
+
 
 class TestMinimumFormulaConsistency:
     """
@@ -42,7 +44,7 @@ class TestMinimumFormulaConsistency:
         assert_status_ok(response)
 
         # Extract tournament ID from URL
-        tournament_id = re.search(r"/tournaments/([^/]+)", str(response.url)).group(1)
+        tournament_id = TOURNAMENT_ID_RE.search(str(response.url)).group(1)
 
         # When - Navigate to add category
         response = staff_client.get(f"/tournaments/{tournament_id}/add-category")
@@ -80,7 +82,7 @@ class TestMinimumFormulaConsistency:
         assert_status_ok(response)
 
         # Extract tournament ID
-        tournament_id = re.search(r"/tournaments/([^/]+)", str(response.url)).group(1)
+        tournament_id = TOURNAMENT_ID_RE.search(str(response.url)).group(1)
 
         # Add category with default values (groups_ideal=2, performers_ideal=4)
         staff_client.post(
@@ -134,7 +136,7 @@ class TestMinimumFormulaConsistency:
             data={"name": "Formula Examples Tournament"},
             follow_redirects=True,
         )
-        tournament_id = re.search(r"/tournaments/([^/]+)", str(response.url)).group(1)
+        tournament_id = TOURNAMENT_ID_RE.search(str(response.url)).group(1)
 
         # Test cases: (groups_ideal, expected_minimum)
         test_cases = [
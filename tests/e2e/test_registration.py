@@ -3,7 +3,6 @@
 Tests dancer registration workflows through HTTP interface.
 Target: Improve coverage from 16% to 80%+
 """
-import pytest
 from uuid import uuid4
 
 from tests.e2e import (
@@ -11,7 +10,6 @@ from tests.e2e import (
     htmx_headers,
     assert_status_ok,
     assert_redirect,
-    assert_contains_text,
 )
 
 
@@ -74,7 +72,7 @@ class TestRegistrationPageAccess:
         # Then
         assert response.status_code == 404
 
-    def test_registration_page_loads_with_data(self, staff_client, create_e2e_tournament):
+    def test_registration_page_loads_with_data(self, staff_client, make_tournament):
         """GET /registration/{t_id}/{c_id} loads with valid tournament/category.
 
         Validates: DOMAIN_MODEL.md Performer registration access
@@ -86,12 +84,8 @@ class TestRegistrationPageAccess:
             And I see the category name
             And I see the tournament ID in breadcrumb
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=0)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=0)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -104,7 +98,7 @@ class TestRegistrationPageAccess:
         assert category.name in response.text
         assert str(tournament.id) in response.text
 
-    def test_registration_page_with_search(self, staff_client, create_e2e_tournament):
+    def test_registration_page_with_search(self, staff_client, make_tournament):
         """GET /registration/{t_id}/{c_id}?search= returns search results.
 
         Validates: DOMAIN_MODEL.md Performer search
@@ -114,12 +108,8 @@ class TestRegistrationPageAccess:
             When I navigate to /registration/{tournament_id}/{category_id}?search=dancer
             Then the page loads successfully (200)
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=2)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=2)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -157,7 +147,7 @@ class TestRegisterSingleDancer:
         # Then
         assert response.status_code in [401, 302, 303]
 
-    def test_register_dancer_invalid_uuid(self, staff_client, create_e2e_tournament):
+    def test_register_dancer_invalid_uuid(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/register rejects invalid UUID.
 
         Validates: [Derived] HTTP input validation
@@ -167,12 +157,8 @@ class TestRegisterSingleDancer:
             When I POST to /registration/{tournament_id}/{category_id}/register with invalid dancer_id
             Then I am redirected (303) with a flash error
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=0)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=0)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -186,7 +172,7 @@ class TestRegisterSingleDancer:
         # Then - Redirects with flash error
         assert response.status_code == 303
 
-    def test_register_dancer_nonexistent_dancer_returns_404(self, staff_client, create_e2e_tournament):
+    def test_register_dancer_nonexistent_dancer_returns_404(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/register returns 404 for non-existent dancer.
 
         Validates: [Derived] HTTP 404 pattern for missing resources
@@ -197,12 +183,8 @@ class TestRegisterSingleDancer:
             When I POST to /registration/{tournament_id}/{category_id}/register
             Then I receive a 404 Not Found response
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=0)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=0)
         tournament = data["tournament"]
         category = data["categories"][0]
         fake_dancer = uuid4()
@@ -217,7 +199,7 @@ class TestRegisterSingleDancer:
         # Then
         assert response.status_code == 404
 
-    def test_register_dancer_success(self, staff_client, create_e2e_tournament):
+    def test_register_dancer_success(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/register successfully registers dancer.
 
         Validates: DOMAIN_MODEL.md Performer entity creation
@@ -228,12 +210,8 @@ class TestRegisterSingleDancer:
             When I create a new dancer via /dancers/create
             Then the dancer creation succeeds (200)
         """
-        import asyncio
-
         # Given - Create tournament with category but no performers, and get a dancer
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=1)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=1)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -257,7 +235,7 @@ class TestRegisterSingleDancer:
         # For this test, we verify the registration endpoint behavior
         assert_status_ok(create_resp)
 
-    def test_register_duplicate_dancer_rejected(self, staff_client, create_e2e_tournament):
+    def test_register_duplicate_dancer_rejected(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/register rejects duplicate registration.
 
         Validates: VALIDATION_RULES.md One Dancer Per Tournament Rule
@@ -268,12 +246,8 @@ class TestRegisterSingleDancer:
             When I POST to /registration/{tournament_id}/{category_id}/register with same dancer
             Then I am redirected (303) with a flash error about duplicate
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=1)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=1)
         tournament = data["tournament"]
         category = data["categories"][0]
         dancer = data["dancers"][0]  # Already registered
@@ -336,7 +310,7 @@ class TestRegisterDuo:
         # Then
         assert response.status_code == 400
 
-    def test_register_duo_same_dancer_rejected(self, staff_client, create_e2e_tournament):
+    def test_register_duo_same_dancer_rejected(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/register-duo rejects same dancer twice.
 
         Validates: VALIDATION_RULES.md Duo Registration Validation
@@ -347,12 +321,8 @@ class TestRegisterDuo:
             Then I receive a 400 Bad Request response
             And the error message mentions "same dancer"
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=2)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=2)
         tournament = data["tournament"]
         category = data["categories"][0]
         dancer = data["dancers"][0]
@@ -390,7 +360,7 @@ class TestRegisterDuo:
         # Then
         assert response.status_code == 404
 
-    def test_register_duo_not_duo_category(self, staff_client, create_e2e_tournament):
+    def test_register_duo_not_duo_category(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/register-duo rejects non-duo category.
 
         Validates: VALIDATION_RULES.md Duo Registration Validation
@@ -400,12 +370,8 @@ class TestRegisterDuo:
             When I POST to /registration/{tournament_id}/{category_id}/register-duo
             Then I receive either 400 (category not duo) or 404 (dancers not found)
         """
-        import asyncio
-
         # Given - Default category is not duo (is_duo=False)
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=2)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=2)
         tournament = data["tournament"]
         category = data["categories"][0]  # Not a duo category
         # Use fake dancer IDs to test category validation
@@ -442,7 +408,7 @@ class TestUnregisterDancer:
         # Then
         assert response.status_code in [401, 302, 303]
 
-    def test_unregister_invalid_uuid(self, staff_client, create_e2e_tournament):
+    def test_unregister_invalid_uuid(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/unregister/{p_id} handles invalid UUID.
 
         Validates: [Derived] HTTP input validation
@@ -452,12 +418,8 @@ class TestUnregisterDancer:
             When I POST to /registration/{tournament_id}/{category_id}/unregister/not-a-uuid
             Then I am redirected (303) with a flash error
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=1)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=1)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -470,7 +432,7 @@ class TestUnregisterDancer:
         # Then - Redirects with flash error
         assert response.status_code == 303
 
-    def test_unregister_nonexistent_performer_returns_404(self, staff_client, create_e2e_tournament):
+    def test_unregister_nonexistent_performer_returns_404(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/unregister/{p_id} returns 404 for non-existent performer.
 
         Validates: [Derived] HTTP 404 pattern for missing resources
@@ -481,12 +443,8 @@ class TestUnregisterDancer:
             When I POST to /registration/{tournament_id}/{category_id}/unregister/{performer_id}
             Then I receive a 404 Not Found response
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=1)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=1)
         tournament = data["tournament"]
         category = data["categories"][0]
         fake_performer = uuid4()
@@ -500,7 +458,7 @@ class TestUnregisterDancer:
         # Then
         assert response.status_code == 404
 
-    def test_unregister_success(self, staff_client, create_e2e_tournament):
+    def test_unregister_success(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/unregister/{p_id} successfully unregisters.
 
         Validates: DOMAIN_MODEL.md Performer entity deletion
@@ -510,12 +468,8 @@ class TestUnregisterDancer:
             When I POST to /registration/{tournament_id}/{category_id}/unregister/{performer_id}
             Then I am redirected to the registration page
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=1)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=1)
         tournament = data["tournament"]
         category = data["categories"][0]
         performer = data["performers"][0]
@@ -591,7 +545,7 @@ class TestSearchDancerAPI:
         # Then
         assert response.status_code == 404
 
-    def test_search_dancer_returns_partial(self, staff_client, create_e2e_tournament):
+    def test_search_dancer_returns_partial(self, staff_client, make_tournament):
         """GET /registration/{t_id}/{c_id}/search-dancer returns partial HTML.
 
         Validates: FRONTEND.md HTMX Patterns (partial HTML responses)
@@ -602,12 +556,8 @@ class TestSearchDancerAPI:
             Then the response is successful (200)
             And the response is partial HTML
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=0)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=0)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -621,7 +571,7 @@ class TestSearchDancerAPI:
         assert_status_ok(response)
         assert is_partial_html(response.text)
 
-    def test_search_dancer_with_dancer_number(self, staff_client, create_e2e_tournament):
+    def test_search_dancer_with_dancer_number(self, staff_client, make_tournament):
         """GET /registration/{t_id}/{c_id}/search-dancer accepts dancer_number param.
 
         Validates: FRONTEND.md HTMX Patterns (duo dancer search)
@@ -631,12 +581,8 @@ class TestSearchDancerAPI:
             When I call /registration/{tournament_id}/{category_id}/search-dancer with dancer_number=2
             Then the response is successful (200)
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=0)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=0)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -715,7 +661,7 @@ class TestAvailableDancersPartial:
         assert_status_ok(response)
         assert "not found" in response.text.lower()
 
-    def test_available_returns_partial(self, staff_client, create_e2e_tournament):
+    def test_available_returns_partial(self, staff_client, make_tournament):
         """GET /registration/{t_id}/{c_id}/available returns partial HTML.
 
         Validates: FRONTEND.md HTMX Patterns (partial HTML responses)
@@ -726,12 +672,8 @@ class TestAvailableDancersPartial:
             Then the response is successful (200)
             And the response is partial HTML
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=0)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=0)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -745,7 +687,7 @@ class TestAvailableDancersPartial:
         assert_status_ok(response)
         assert is_partial_html(response.text)
 
-    def test_available_with_search(self, staff_client, create_e2e_tournament):
+    def test_available_with_search(self, staff_client, make_tournament):
         """GET /registration/{t_id}/{c_id}/available accepts search query.
 
         Validates: DOMAIN_MODEL.md Performer search
@@ -755,12 +697,8 @@ class TestAvailableDancersPartial:
             When I call /registration/{tournament_id}/{category_id}/available?q=dancer
             Then the response is successful (200)
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=2)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=2)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -839,7 +777,7 @@ class TestRegisteredDancersPartial:
         assert_status_ok(response)
         assert "not found" in response.text.lower()
 
-    def test_registered_returns_partial(self, staff_client, create_e2e_tournament):
+    def test_registered_returns_partial(self, staff_client, make_tournament):
         """GET /registration/{t_id}/{c_id}/registered returns partial HTML.
 
         Validates: FRONTEND.md HTMX Patterns (partial HTML responses)
@@ -850,12 +788,8 @@ class TestRegisteredDancersPartial:
             Then the response is successful (200)
             And the response is partial HTML
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=2)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=2)
         tournament = data["tournament"]
         category = data["categories"][0]
 
@@ -935,7 +869,7 @@ class TestHTMXRegister:
         assert_status_ok(response)
         assert "Not found" in response.text
 
-    def test_htmx_register_returns_partial(self, staff_client, create_e2e_tournament):
+    def test_htmx_register_returns_partial(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/register/{d_id} returns partial with OOB.
 
         Validates: VALIDATION_RULES.md One Dancer Per Tournament Rule
@@ -947,12 +881,8 @@ class TestHTMXRegister:
             Then the response is successful (200)
             And the response contains "already registered" message
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=2)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=2)
         tournament = data["tournament"]
         category = data["categories"][0]
         dancer = data["dancers"][0]
@@ -1033,7 +963,7 @@ class TestHTMXUnregister:
         assert_status_ok(response)
         assert "not found" in response.text.lower()
 
-    def test_htmx_unregister_returns_partial(self, staff_client, create_e2e_tournament):
+    def test_htmx_unregister_returns_partial(self, staff_client, make_tournament):
         """POST /registration/{t_id}/{c_id}/unregister-htmx/{p_id} returns partial with OOB.
 
         Validates: FRONTEND.md HTMX Patterns (OOB swap)
@@ -1044,12 +974,8 @@ class TestHTMXUnregister:
             Then the response is successful (200)
             And the response is partial HTML
         """
-        import asyncio
-
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=1, performers_per_category=2)
-        )
+        data = make_tournament(num_categories=1, performers_per_category=2)
         tournament = data["tournament"]
         category = data["categories"][0]
         performer = data["performers"][0]
@@ -7,7 +7,6 @@ This file explores two approaches to fix the session isolation problem:
 Run with: pytest tests/e2e/test_session_isolation_fix.py -v
 """
 import pytest
-import pytest_asyncio
 from datetime import date
 from uuid import uuid4
 
@@ -17,7 +16,7 @@ from fastapi.testclient import TestClient
 from app.main import app
 # Use isolated test database - NEVER import test_session_maker from app.db.database!
 from app.db.database import get_db
-from tests.conftest import test_session_maker
+from tests.conftest import MockEmailProvider, session_cookie, test_session_maker
 from app.repositories.tournament import TournamentRepository
 from app.repositories.category import CategoryRepository
 from app.repositories.dancer import DancerRepository
@@ -28,33 +27,9 @@ from app.models.tournament import TournamentPhase
 from app.auth import magic_link_auth
 from app.config import settings
 from app.services.email.service import EmailService
-from app.services.email.provider import BaseEmailProvider
 from app.dependencies import get_email_service
 
 
-# =============================================================================
-# MOCK EMAIL PROVIDER (needed for both approaches)
-# =============================================================================
-
-
-class MockEmailProvider(BaseEmailProvider):
-    """Mock email provider for testing."""
-
-    def __init__(self):
-        self.sent_emails = []
-
-    async def send_magic_link(
-        self, to_email: str, magic_link: str, first_name: str
-    ) -> bool:
-        self.sent_emails.append(
-            {"to_email": to_email, "magic_link": magic_link, "first_name": first_name}
-        )
-        return True
-
-    def clear(self):
-        self.sent_emails = []
-
-
 # =============================================================================
 # APPROACH 1: AsyncClient with Shared Session Override
 # =============================================================================
@@ -307,14 +282,7 @@ class TestHTTPOnlyApproach:
         token = magic_link_auth.generate_token("http_test@test.com", "staff")
         response = sync_client.get(f"/auth/verify?token={token}", follow_redirects=False)
 
-        # Extract cookie
-        cookie_name = settings.SESSION_COOKIE_NAME
-        set_cookie = response.headers.get("set-cookie", "")
-        start = set_cookie.find(f"{cookie_name}=") + len(f"{cookie_name}=")
-        end = set_cookie.find(";", start)
-        cookie_value = set_cookie[start:end]
-
-        return {cookie_name: cookie_value}
+        return {settings.SESSION_COOKIE_NAME: session_cookie(response)}
 
     def test_create_and_view_tournament_via_http(self, sync_client, auth_cookies):
         """Create tournament via HTTP, then view it via HTTP.
@@ -9,7 +9,7 @@ See: workbench/FEATURE_SPEC_2024-12-24_tournament-deletion-fix.md
 import pytest
 from uuid import uuid4
 
-from app.models.tournament import TournamentStatus, TournamentPhase
+from app.models.tournament import TournamentStatus
 
 
 class TestTournamentDeletion:
@@ -109,6 +109,8 @@ class TestTournamentDeletion:
         data = await create_e2e_tournament(
             name="Tournament To Delete",
             status=TournamentStatus.CREATED,
+            num_categories=0,
+            performers_per_category=0,
         )
         tournament_id = data["tournament"].id
 
@@ -139,6 +141,8 @@ class TestTournamentDeletion:
         data = await create_e2e_tournament(
             name="Active Tournament",
             status=TournamentStatus.ACTIVE,
+            num_categories=0,
+            performers_per_category=0,
         )
         tournament_id = data["tournament"].id
 
@@ -173,6 +177,8 @@ class TestTournamentDeletion:
         data = await create_e2e_tournament(
             name="Completed Tournament",
             status=TournamentStatus.COMPLETED,
+            num_categories=0,
+            performers_per_category=0,
         )
         tournament_id = data["tournament"].id
 
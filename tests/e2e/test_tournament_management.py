@@ -3,16 +3,16 @@
 Tests tournament setup through HTTP interface.
 See: FEATURE_SPEC_2025-12-08_E2E-TESTING-FRAMEWORK.md §3.2
 """
-import pytest
-import asyncio
+import re
 
-from app.models.tournament import TournamentPhase
 from tests.e2e import (
     assert_status_ok,
     assert_redirect,
-    assert_contains_text,
 )
 
+# Case-insensitive search on the raw body: no decoded/lowercased copy
+NAME_FIELD_RE = re.compile(rb"name", re.IGNORECASE)
+
 
 class TestTournamentCreation:
     """Test creating tournaments via HTTP."""
@@ -34,7 +34,7 @@ class TestTournamentCreation:
 
         # Then
         assert_status_ok(response)
-        assert "name" in response.text.lower()
+        assert NAME_FIELD_RE.search(response.content)
 
     def test_create_tournament_success(self, staff_client):
         """POST /tournaments/create creates tournament and redirects.
@@ -125,7 +125,7 @@ class TestTournamentList:
 class TestTournamentDetail:
     """Test tournament detail page."""
 
-    def test_tournament_detail_loads(self, staff_client, create_e2e_tournament):
+    def test_tournament_detail_loads(self, staff_client, shared_e2e_tournament):
         """GET /tournaments/{id} loads tournament detail page.
 
         Validates: DOMAIN_MODEL.md Tournament entity access
@@ -137,10 +137,7 @@ class TestTournamentDetail:
             And I see the tournament name
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament()
-        )
-        tournament = data["tournament"]
+        tournament = shared_e2e_tournament["tournament"]
 
         # When
         response = staff_client.get(f"/tournaments/{tournament.id}")
@@ -150,7 +147,7 @@ class TestTournamentDetail:
         assert tournament.name in response.text
 
     def test_tournament_detail_shows_categories(
-        self, staff_client, create_e2e_tournament
+        self, staff_client, shared_tournament_with_2_categories
     ):
         """GET /tournaments/{id} shows category information.
 
@@ -163,10 +160,7 @@ class TestTournamentDetail:
             And I see the category information
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=2)
-        )
-        tournament = data["tournament"]
+        tournament = shared_tournament_with_2_categories["tournament"]
 
         # When
         response = staff_client.get(f"/tournaments/{tournament.id}")
@@ -180,45 +174,39 @@ class TestTournamentDetail:
 class TestCategoryManagement:
     """Test adding categories to tournaments via HTTP."""
 
-    def test_add_category_form_loads(self, staff_client, create_e2e_tournament):
+    def test_add_category_form_loads(self, staff_client, shared_e2e_tournament):
         """GET /tournaments/{id}/add-category loads form.
 
         Validates: DOMAIN_MODEL.md Category entity creation
         Gherkin:
             Given I am authenticated as Staff
-            And a tournament exists with no categories
+            And a tournament exists
             When I navigate to /tournaments/{id}/add-category
             Then the page loads successfully (200)
             And I see a name input field
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=0)
-        )
-        tournament = data["tournament"]
+        tournament = shared_e2e_tournament["tournament"]
 
         # When
         response = staff_client.get(f"/tournaments/{tournament.id}/add-category")
 
         # Then
         assert_status_ok(response)
-        assert "name" in response.text.lower()
+        assert NAME_FIELD_RE.search(response.content)
 
-    def test_add_category_to_tournament(self, staff_client, create_e2e_tournament):
+    def test_add_category_to_tournament(self, staff_client, shared_e2e_tournament):
         """POST /tournaments/{id}/add-category creates category.
 
         Validates: DOMAIN_MODEL.md Category entity creation
         Gherkin:
             Given I am authenticated as Staff
-            And a tournament exists with no categories
+            And a tournament exists
             When I POST to /tournaments/{id}/add-category with category data
             Then I am redirected to the tournament detail page
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=0, performers_per_category=0)
-        )
-        tournament = data["tournament"]
+        tournament = shared_e2e_tournament["tournament"]
 
         # When
         response = staff_client.post(
@@ -235,7 +223,7 @@ class TestCategoryManagement:
         # Then
         assert_redirect(response)
 
-    def test_category_appears_on_detail_page(self, staff_client, create_e2e_tournament):
+    def test_category_appears_on_detail_page(self, staff_client, shared_e2e_tournament):
         """Added category appears on tournament detail page.
 
         Validates: DOMAIN_MODEL.md Category entity display
@@ -247,10 +235,7 @@ class TestCategoryManagement:
             Then I see "Visible Category" on the page
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(num_categories=0, performers_per_category=0)
-        )
-        tournament = data["tournament"]
+        tournament = shared_e2e_tournament["tournament"]
 
         # When - Add category
         staff_client.post(
@@ -280,7 +265,7 @@ class TestPhaseOverview:
     See: FEATURE_SPEC_2024-12-18_SCREEN-CONSOLIDATION.md
     """
 
-    def test_phase_overview_loads(self, staff_client, create_e2e_tournament):
+    def test_phase_overview_loads(self, staff_client, shared_e2e_tournament):
         """GET /tournaments/{id}/phase returns 404 (route removed).
 
         Validates: BR-NAV-001 - Single path to functions
@@ -291,10 +276,7 @@ class TestPhaseOverview:
             Then I receive a 404 Not Found response
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament()
-        )
-        tournament = data["tournament"]
+        tournament = shared_e2e_tournament["tournament"]
 
         # When
         response = staff_client.get(f"/tournaments/{tournament.id}/phase")
@@ -303,17 +285,14 @@ class TestPhaseOverview:
         assert response.status_code == 404
 
     def test_phase_overview_shows_current_phase(
-        self, staff_client, create_e2e_tournament
+        self, staff_client, shared_e2e_tournament
     ):
         """GET /tournaments/{id}/phase returns 404 (route removed).
 
         Note: Phase information is now shown in Event Mode.
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament()
-        )
-        tournament = data["tournament"]
+        tournament = shared_e2e_tournament["tournament"]
 
         # When
         response = staff_client.get(f"/tournaments/{tournament.id}/phase")
@@ -330,7 +309,7 @@ class TestPhaseAdvancement:
     the tournament detail page.
     """
 
-    def test_advance_phase_requires_admin(self, staff_client, create_e2e_tournament):
+    def test_advance_phase_requires_admin(self, staff_client, shared_e2e_tournament):
         """POST /tournaments/{id}/advance requires admin role.
 
         Validates: DOMAIN_MODEL.md User roles (admin-only phase advancement)
@@ -341,10 +320,7 @@ class TestPhaseAdvancement:
             Then I am denied access (401/403)
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(performers_per_category=4)
-        )
-        tournament = data["tournament"]
+        tournament = shared_e2e_tournament["tournament"]
 
         # When
         response = staff_client.post(
@@ -355,7 +331,7 @@ class TestPhaseAdvancement:
         # Then - staff should not be able to advance phases
         assert response.status_code in [401, 403]
 
-    def test_advance_phase_works_for_admin(self, admin_client, create_e2e_tournament):
+    def test_advance_phase_works_for_admin(self, admin_client, shared_e2e_tournament):
         """POST /tournaments/{id}/advance works for admin.
 
         Validates: Issue #6 - Phase advancement from tournament detail
@@ -366,10 +342,7 @@ class TestPhaseAdvancement:
             Then I receive a response (200 for validation, 303 for redirect)
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(performers_per_category=4)
-        )
-        tournament = data["tournament"]
+        tournament = shared_e2e_tournament["tournament"]
 
         # When
         response = admin_client.post(
@@ -380,16 +353,13 @@ class TestPhaseAdvancement:
         # Then - should work (may show validation or redirect)
         assert response.status_code in [200, 302, 303, 400]
 
-    def test_advance_phase_redirects_to_detail(self, admin_client, create_e2e_tournament):
+    def test_advance_phase_redirects_to_detail(self, admin_client, shared_e2e_tournament):
         """POST /tournaments/{id}/advance redirects back to detail page.
 
         Validates: Issue #6 - Phase advancement from tournament detail
         """
         # Given
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(performers_per_category=4)
-        )
-        tournament = data["tournament"]
+        tournament = shared_e2e_tournament["tournament"]
 
         # When
         response = admin_client.post(
@@ -11,11 +11,152 @@ Business Rules:
 - BR-UX-003: Permission display uses checkmark symbols
 - BR-UX-004: All templates follow SCSS design system patterns
 """
+import os
 import pytest
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
+# =============================================================================
+# TEMPLATE SCAN (single pass shared by the scanning tests)
+# =============================================================================
+
+TEMPLATES_DIR = Path("app/templates")
+
+
+def _iter_html(root):
+    """Yield (relative_path, absolute_path) strings for every .html under root.
+
+    Walks with os.scandir and an explicit directory stack, so no Path object
+    is built per directory or file as rglob() does.
+    """
+    if not os.path.isdir(root):
+        return
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".html"):
+                    yield os.path.relpath(entry.path, root), entry.path
+
+
+# Walked once at import; every scan iterates this instead of re-walking
+TEMPLATE_FILES = tuple(_iter_html(str(TEMPLATES_DIR)))
+
+# One regex for every scanning rule. Each alternative sits inside a lookahead
+# so matches may overlap (e.g. a style attribute inside a <button> tag) and
+# the named group that matched tells which rule bucket it belongs to.
+# The optional btn_class lookahead records whether a button tag's class
+# attribute starts with the btn class, so no per-tag check is needed.
+_UNION_RE = re.compile(
+    rb"""(?=[<csS])  # cheap first-byte check before trying the alternatives
+    (?=
+        (?P<style>(?i:\bstyle\s*=\s*["']))
+      | (?P<badge>class\s*=\s*["'](?P<classes>[^"']*\bbadge-[^"']*))
+      | (?P<table>(?i:<table[^>]*>))
+      | (?P<button>(?i:<button(?=(?P<btn_class>[^>]*class=["']btn))?
+                       [^>]*type\s*=\s*["'](?:submit|button)["'][^>]*>))
+    )""",
+    re.VERBOSE,
+)
+
+# Every badge class inside one class attribute value, found in a single pass
+# (the attribute may hold several, e.g. {% if %}badge-a{% else %}badge-b)
+_BADGE_CLASS_RE = re.compile(rb"\bbadge-\w+\b")
+
+# A table is a data table when <thead> opens within 500 bytes of it
+_THEAD_RE = re.compile(rb"<thead", re.IGNORECASE)
+_THEAD_WINDOW = 500
+
+# role="grid" inside a table opening tag, any case or quote style
+_ROLE_GRID_RE = re.compile(rb"""role\s*=\s*["']grid["']""", re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
+def html_templates():
+    """Read every template once per session.
+
+    Contents are kept as bytes: every scan pattern matches ASCII markup
+    only, so decoding the files to str would be wasted work.
+
+    Returns:
+        List of (relative_path, content) tuples.
+    """
+    if not TEMPLATE_FILES:
+        pytest.skip(f"No templates found under {TEMPLATES_DIR}")
+
+    templates = []
+    for relative_path, template_path in TEMPLATE_FILES:
+        with open(template_path, "rb") as template_file:
+            templates.append((relative_path, template_file.read()))
+    return templates
+
+
+@dataclass
+class TemplateScan:
+    """What the scanning tests need to know about one template.
+
+    Attributes:
+        relative_path: Path under app/templates
+        inline_styles: Number of style="..." attributes
+        badge_classes: Every badge-* class used in class attributes
+        tables_without_role: Data tables (<thead> follows) lacking role="grid"
+        buttons: Number of type="submit"/"button" buttons
+        buttons_with_btn_class: Buttons whose class attribute starts with btn
+    """
+
+    relative_path: str
+    inline_styles: int = 0
+    badge_classes: list[str] = field(default_factory=list)
+    tables_without_role: int = 0
+    buttons: int = 0
+    buttons_with_btn_class: int = 0
+
+
+def _scan_template(relative_path, content):
+    """Run every scanning rule over one template in a single regex pass."""
+    scan = TemplateScan(relative_path)
+
+    for match in _UNION_RE.finditer(content):
+        rule = match.lastgroup
+        if rule == "style":
+            scan.inline_styles += 1
+        elif rule == "badge":
+            scan.badge_classes.extend(
+                badge.decode("ascii")
+                for badge in _BADGE_CLASS_RE.findall(match.group("classes"))
+            )
+        elif rule == "table":
+            # Bounded search: no slice copy or lowercasing per table
+            start = match.start()
+            is_data_table = _THEAD_RE.search(content, start, start + _THEAD_WINDOW)
+            if is_data_table and not _ROLE_GRID_RE.search(match.group(rule)):
+                scan.tables_without_role += 1
+        else:
+            scan.buttons += 1
+            if match.group("btn_class") is not None:
+                scan.buttons_with_btn_class += 1
+
+    return scan
+
+
+@pytest.fixture(scope="session")
+def template_scans(html_templates):
+    """Scan every template once; the scanning tests read their own fields.
+
+    Returns:
+        List of TemplateScan, one per template.
+    """
+    return [
+        _scan_template(relative_path, content)
+        for relative_path, content in html_templates
+    ]
+
+
 # =============================================================================
 # TEMPLATE SCANNING TESTS
 # =============================================================================
@@ -37,7 +178,7 @@ class TestNoInlineStyles:
     # Maximum inline styles allowed (threshold approach)
     MAX_INLINE_STYLES_PER_TEMPLATE = 0
 
-    def test_no_inline_styles_in_templates(self):
+    def test_no_inline_styles_in_templates(self, template_scans):
         """Templates should not contain inline style attributes.
 
         Validates: BR-UX-001 No inline styles in production templates
@@ -48,26 +189,18 @@ class TestNoInlineStyles:
             And allowlisted templates are documented exceptions
         """
         # Given
-        templates_dir = Path("app/templates")
-        inline_style_pattern = re.compile(r'\bstyle\s*=\s*["\']', re.IGNORECASE)
-
         violations = []
 
-        # When - scan all templates
-        for template_path in templates_dir.rglob("*.html"):
-            relative_path = str(template_path.relative_to(templates_dir))
-
+        # When - check scanned templates
+        for scan in template_scans:
             # Skip allowlisted templates
-            if relative_path in self.ALLOWLIST:
+            if scan.relative_path in self.ALLOWLIST:
                 continue
 
-            content = template_path.read_text()
-            matches = inline_style_pattern.findall(content)
-
             # Then - check threshold
-            if len(matches) > self.MAX_INLINE_STYLES_PER_TEMPLATE:
+            if scan.inline_styles > self.MAX_INLINE_STYLES_PER_TEMPLATE:
                 violations.append(
-                    f"{relative_path}: {len(matches)} inline style(s) found"
+                    f"{scan.relative_path}: {scan.inline_styles} inline style(s) found"
                 )
 
         # Assert
@@ -85,7 +218,7 @@ class TestBadgeClassConsistency:
     """
 
     # Valid badge classes per FRONTEND.md and SCSS design system
-    VALID_BADGE_CLASSES = {
+    VALID_BADGE_CLASSES = frozenset({
         # Core badge classes (SCSS design system)
         "badge-pending",
         "badge-active",
@@ -102,9 +235,9 @@ class TestBadgeClassConsistency:
         "badge-cancelled",
         # Role badge
         "badge-role",
-    }
+    })
 
-    def test_badge_classes_are_valid(self):
+    def test_badge_classes_are_valid(self, template_scans):
         """Badge classes should only use defined patterns.
 
         Validates: BR-UX-002 Consistent badge class usage
@@ -114,21 +247,14 @@ class TestBadgeClassConsistency:
             Then all badge classes should be from the approved set
         """
         # Given
-        templates_dir = Path("app/templates")
-        # Match badge-* class names
-        badge_class_pattern = re.compile(r'class\s*=\s*["\'][^"\']*\b(badge-\w+)\b')
-
         invalid_badges = []
+        valid_badge_classes = self.VALID_BADGE_CLASSES
 
-        # When - scan all templates
-        for template_path in templates_dir.rglob("*.html"):
-            relative_path = str(template_path.relative_to(templates_dir))
-            content = template_path.read_text()
-
-            for match in badge_class_pattern.finditer(content):
-                badge_class = match.group(1)
-                if badge_class not in self.VALID_BADGE_CLASSES:
-                    invalid_badges.append(f"{relative_path}: {badge_class}")
+        # When - check scanned badge classes
+        for scan in template_scans:
+            for badge_class in scan.badge_classes:
+                if badge_class not in valid_badge_classes:
+                    invalid_badges.append(f"{scan.relative_path}: {badge_class}")
 
         # Then
         assert not invalid_badges, (
@@ -147,7 +273,7 @@ class TestPermissionDisplayFormat:
     Permission display is now tested via admin/users.html
     """
 
-    def test_admin_users_permission_display_uses_checkmarks(self, admin_client):
+    def test_admin_users_permission_display_uses_checkmarks(self, admin_page):
         """Admin users table should use checkmark symbols for permissions.
 
         Validates: BR-UX-003 Permission display uses checkmark symbols
@@ -156,10 +282,10 @@ class TestPermissionDisplayFormat:
             When I view the users admin page
             Then permissions are displayed with checkmarks (not Yes/No)
         """
-        # Given (authenticated via admin_client fixture)
+        # Given (authenticated via admin_page fixture)
 
         # When
-        response = admin_client.get("/admin/users")
+        response = admin_page("/admin/users")
 
         # Then
         content = response.text
@@ -182,7 +308,7 @@ class TestSemanticHtmlPatterns:
     Validates: FRONTEND.md §Semantic HTML Patterns
     """
 
-    def test_tables_use_role_grid(self):
+    def test_tables_use_role_grid(self, template_scans):
         """Data tables should use role='grid' for accessibility.
 
         Validates: BR-UX-004 table accessibility patterns
@@ -191,37 +317,10 @@ class TestSemanticHtmlPatterns:
             When I check table markup
             Then tables should use role="grid" attribute
         """
-        # Given
-        templates_dir = Path("app/templates")
-        # Match tables that look like data tables (with thead)
-        table_with_thead = re.compile(
-            r'<table[^>]*>.*?<thead>', re.DOTALL | re.IGNORECASE
-        )
-        table_with_role = re.compile(r'<table[^>]*role\s*=\s*["\']grid["\']')
-
-        tables_without_role = []
-
-        # When - scan templates with data tables
-        for template_path in templates_dir.rglob("*.html"):
-            relative_path = str(template_path.relative_to(templates_dir))
-            content = template_path.read_text()
-
-            # Find tables with thead (data tables)
-            if table_with_thead.search(content):
-                # Check if they have role="grid"
-                table_start = content.find("<table")
-                while table_start != -1:
-                    table_end = content.find(">", table_start)
-                    table_tag = content[table_start : table_end + 1]
-
-                    # Check if this table has thead (is a data table)
-                    next_content = content[table_start:table_start + 500]
-                    if "<thead" in next_content.lower():
-                        if 'role="grid"' not in table_tag.lower() and "role='grid'" not in table_tag.lower():
-                            tables_without_role.append(relative_path)
-                            break  # One per template is enough
-
-                    table_start = content.find("<table", table_end)
+        # When - check data tables (tables followed by <thead>)
+        tables_without_role = [
+            scan.relative_path for scan in template_scans if scan.tables_without_role
+        ]
 
         # Then - All data tables should have role="grid"
         # Note: This is a warning, not failure (progressive enhancement)
@@ -231,7 +330,7 @@ class TestSemanticHtmlPatterns:
                 + ", ".join(tables_without_role[:5])
             )
 
-    def test_buttons_use_btn_class(self):
+    def test_buttons_use_btn_class(self, template_scans):
         """Action buttons should use .btn class from SCSS design system.
 
         Validates: BR-UX-004 SCSS button patterns
@@ -240,25 +339,9 @@ class TestSemanticHtmlPatterns:
             When I check button markup
             Then buttons should use class="btn" or class="btn btn-*" attributes
         """
-        # Given
-        templates_dir = Path("app/templates")
-        # Pattern for buttons (submit, button types)
-        button_pattern = re.compile(
-            r'<button[^>]*type\s*=\s*["\'](?:submit|button)["\'][^>]*>',
-            re.IGNORECASE
-        )
-
         # When - count buttons with/without btn class
-        total_buttons = 0
-        buttons_with_class = 0
-
-        for template_path in templates_dir.rglob("*.html"):
-            content = template_path.read_text()
-
-            for match in button_pattern.finditer(content):
-                total_buttons += 1
-                if 'class="btn' in match.group().lower() or "class='btn" in match.group().lower():
-                    buttons_with_class += 1
+        total_buttons = sum(scan.buttons for scan in template_scans)
+        buttons_with_class = sum(scan.buttons_with_btn_class for scan in template_scans)
 
         # Then - Most buttons should have btn class
         if total_buttons > 0:
@@ -295,49 +378,40 @@ class TestPagesLoadWithoutError:
         assert response.status_code == 302
         assert response.headers["location"] == "/tournaments"
 
-    def test_tournaments_list_loads(self, staff_client):
-        """Tournaments list page loads successfully after UX refactor.
-
-        Validates: tournaments/list.html template integrity
+    @pytest.mark.parametrize(
+        "url, expected_texts",
+        [
+            # tournaments/list.html: tournament management elements
+            ("/tournaments", ("Tournament",)),
+            # dancers/list.html: dancer list with HTMX search input
+            ("/dancers", ("Dancer", "search")),
+        ],
+    )
+    def test_page_loads(self, staff_page, url, expected_texts):
+        """Staff pages load successfully after UX refactor.
+
+        Validates: tournaments/list.html and dancers/list.html template integrity
         Gherkin:
             Given I am authenticated as Staff
-            When I navigate to /tournaments
+            When I navigate to the page
             Then the page loads successfully (200)
-            And contains tournament management elements
+            And contains its expected elements
         """
         # Given (authenticated)
 
         # When
-        response = staff_client.get("/tournaments")
+        response = staff_page(url)
 
         # Then
         assert response.status_code == 200
-        assert "Tournament" in response.text
+        for text in expected_texts:
+            assert text in response.text
 
-    def test_dancers_list_loads(self, staff_client):
-        """Dancers list page loads successfully after UX refactor.
-
-        Validates: dancers/list.html template integrity
-        Gherkin:
-            Given I am authenticated as Staff
-            When I navigate to /dancers
-            Then the page loads successfully (200)
-            And contains search functionality
-        """
-        # Given (authenticated)
-
-        # When
-        response = staff_client.get("/dancers")
-
-        # Then
-        assert response.status_code == 200
-        assert "Dancer" in response.text
-        # Verify search input exists (HTMX pattern)
-        assert "search" in response.text.lower()
-
-    def test_admin_users_loads(self, admin_client):
+    def test_admin_users_loads(self, admin_page):
         """Admin users page loads successfully after UX refactor.
 
+        The response is shared with the checkmark test.
+
         Validates: admin/users.html template integrity
         Gherkin:
             Given I am authenticated as Admin
@@ -348,7 +422,7 @@ class TestPagesLoadWithoutError:
         # Given (authenticated)
 
         # When
-        response = admin_client.get("/admin/users")
+        response = admin_page("/admin/users")
 
         # Then
         assert response.status_code == 200
@@ -359,11 +433,29 @@ class TestPagesLoadWithoutError:
 # CSS FILE TESTS
 # =============================================================================
 
+CSS_DIR = Path("app/static/css")
+
+
+@pytest.fixture(scope="session")
+def css_files():
+    """Read every compiled stylesheet once per session.
+
+    Returns:
+        Dict mapping file name (e.g. "main.css") to its content.
+    """
+    return {path.name: path.read_text() for path in CSS_DIR.glob("*.css")}
+
 
 class TestCssFileIntegrity:
     """Test that CSS files contain required class definitions."""
 
-    def test_main_css_exists(self):
+    @pytest.fixture(scope="class")
+    def main_css(self, css_files):
+        """Content of main.css (compiled from SCSS)."""
+        assert "main.css" in css_files, "main.css should exist"
+        return css_files["main.css"]
+
+    def test_main_css_exists(self, css_files):
         """Main CSS file exists after SCSS compilation.
 
         Validates: SCSS build process produces output
@@ -372,13 +464,10 @@ class TestCssFileIntegrity:
             When I check for compiled CSS
             Then main.css should exist
         """
-        # Given
-        css_path = Path("app/static/css/main.css")
-
         # Then
-        assert css_path.exists(), "main.css should exist (compiled from SCSS)"
+        assert "main.css" in css_files, "main.css should exist (compiled from SCSS)"
 
-    def test_badge_classes_defined_in_main_css(self):
+    def test_badge_classes_defined_in_main_css(self, main_css):
         """Badge CSS classes are defined in main stylesheet.
 
         Validates: CSS class definitions exist for badge patterns
@@ -388,24 +477,19 @@ class TestCssFileIntegrity:
             Then core badge classes should be defined
         """
         # Given
-        css_path = Path("app/static/css/main.css")
-        assert css_path.exists(), "main.css should exist"
-
-        content = css_path.read_text()
-
-        # Then - core badge classes should be defined
-        required_classes = [
+        required_classes = (
             ".badge-pending",
             ".badge-active",
             ".badge-completed",
-        ]
+        )
 
-        for css_class in required_classes:
-            assert css_class in content, (
-                f"Missing CSS class definition: {css_class} in main.css"
-            )
+        # When
+        missing = [c for c in required_classes if c not in main_css]
+
+        # Then - core badge classes should be defined
+        assert not missing, f"Missing CSS class definitions in main.css: {missing}"
 
-    def test_btn_classes_defined_in_main_css(self):
+    def test_btn_classes_defined_in_main_css(self, main_css):
         """Button CSS classes are defined in main stylesheet.
 
         Validates: CSS class definitions exist for button patterns
@@ -415,11 +499,15 @@ class TestCssFileIntegrity:
             Then .btn and variants should be defined
         """
         # Given
-        css_path = Path("app/static/css/main.css")
-        content = css_path.read_text()
+        required_classes = (
+            ".btn",
+            ".btn-primary",
+            ".btn-secondary",
+            ".btn-danger",
+        )
+
+        # When
+        missing = [c for c in required_classes if c not in main_css]
 
         # Then - button classes should be defined
-        assert ".btn" in content, "Missing CSS class definition: .btn in main.css"
-        assert ".btn-primary" in content, "Missing CSS class definition: .btn-primary in main.css"
-        assert ".btn-secondary" in content, "Missing CSS class definition: .btn-secondary in main.css"
-        assert ".btn-danger" in content, "Missing CSS class definition: .btn-danger in main.css"
+        assert not missing, f"Missing CSS class definitions in main.css: {missing}"
@@ -18,10 +18,26 @@ from tests.e2e import (
     is_partial_html,
     htmx_headers,
     assert_status_ok,
-    assert_redirect,
-    assert_contains_text,
 )
-from app.models.tournament import TournamentPhase, TournamentStatus
+from app.models.tournament import TournamentPhase
+
+# Constant request headers, built once (httpx copies them per request)
+_HTMX_HEADERS = htmx_headers()
+
+
+# =============================================================================
+# Shared Page Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def tournaments_page(staff_page, shared_e2e_tournament):
+    """GET /tournaments as Staff with one tournament card listed.
+
+    The tournament is the module-shared one and the page is read-only,
+    so staff_page fetches it once and reuses it for every test in the module.
+    """
+    return staff_page("/tournaments")
 
 
 # =============================================================================
@@ -32,8 +48,19 @@ from app.models.tournament import TournamentPhase, TournamentStatus
 class TestTournamentDropdownMenu:
     """Test three dots dropdown menu on tournament cards."""
 
-    def test_tournament_list_contains_dropdown_menu(self, staff_client, create_e2e_tournament):
-        """Tournament list page contains dropdown menu structure.
+    @pytest.mark.parametrize(
+        "expected_texts",
+        [
+            # Issue #1 - Three dots menu structure
+            ("dropdown-trigger", "dropdown-menu", "dropdown-item"),
+            # Issue #1 - View action in dropdown
+            (">View<",),
+            # Issue #1 - Rename action in dropdown
+            ("Rename", "openRenameModal"),
+        ],
+    )
+    def test_tournament_list_dropdown(self, tournaments_page, expected_texts):
+        """Tournament list page contains the dropdown menu and its options.
 
         Validates: Issue #1 - Three dots menu
         Gherkin:
@@ -43,51 +70,15 @@ class TestTournamentDropdownMenu:
             Then I see a dropdown menu with three dots icon
             And the dropdown has View, Rename options
         """
-        # Given
-        import asyncio
-        asyncio.get_event_loop().run_until_complete(create_e2e_tournament())
-
-        # When
-        response = staff_client.get("/tournaments")
-
-        # Then
-        assert_status_ok(response)
-        assert "dropdown-trigger" in response.text
-        assert "dropdown-menu" in response.text
-        assert "dropdown-item" in response.text
-
-    def test_tournament_list_dropdown_has_view_option(self, staff_client, create_e2e_tournament):
-        """Tournament dropdown has View option.
-
-        Validates: Issue #1 - View action in dropdown
-        """
-        # Given
-        import asyncio
-        asyncio.get_event_loop().run_until_complete(create_e2e_tournament())
+        # Given (shared tournament via tournaments_page fixture)
 
         # When
-        response = staff_client.get("/tournaments")
+        response = tournaments_page
 
         # Then
         assert_status_ok(response)
-        assert ">View</a>" in response.text or ">View<" in response.text
-
-    def test_tournament_list_dropdown_has_rename_option(self, staff_client, create_e2e_tournament):
-        """Tournament dropdown has Rename option.
-
-        Validates: Issue #1 - Rename action in dropdown
-        """
-        # Given
-        import asyncio
-        asyncio.get_event_loop().run_until_complete(create_e2e_tournament())
-
-        # When
-        response = staff_client.get("/tournaments")
-
-        # Then
-        assert_status_ok(response)
-        assert "Rename" in response.text
-        assert "openRenameModal" in response.text
+        for text in expected_texts:
+            assert text in response.text
 
 
 # =============================================================================
@@ -98,7 +89,7 @@ class TestTournamentDropdownMenu:
 class TestCategoryRemoval:
     """Test category removal during REGISTRATION phase."""
 
-    def test_category_delete_endpoint_exists(self, admin_client, create_e2e_tournament):
+    def test_category_delete_endpoint_exists(self, admin_client, make_tournament):
         """DELETE /tournaments/{id}/categories/{cat_id} endpoint exists.
 
         Validates: Issue #3 - Category removal endpoint
@@ -109,29 +100,27 @@ class TestCategoryRemoval:
             Then the request is processed (not 404 Method Not Allowed)
         """
         # Given
-        import asyncio
-        data = asyncio.get_event_loop().run_until_complete(create_e2e_tournament())
+        data = make_tournament(performers_per_category=0)
         tournament_id = data["tournament"].id
         category_id = data["categories"][0].id
 
         # When
         response = admin_client.delete(
             f"/tournaments/{tournament_id}/categories/{category_id}",
-            headers=htmx_headers(),
+            headers=_HTMX_HEADERS,
         )
 
         # Then - Should not be 405 Method Not Allowed
         assert response.status_code != 405, "DELETE method should be allowed"
 
-    def test_category_delete_requires_registration_phase(self, admin_client, create_e2e_tournament):
+    def test_category_delete_requires_registration_phase(self, admin_client, make_tournament):
         """Category deletion only allowed during REGISTRATION phase.
 
         Validates: Issue #3 - Phase restriction
         """
         # Given - Tournament in PRESELECTION phase
-        import asyncio
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(phase=TournamentPhase.PRESELECTION)
+        data = make_tournament(
+            phase=TournamentPhase.PRESELECTION, performers_per_category=0
         )
         tournament_id = data["tournament"].id
         category_id = data["categories"][0].id
@@ -139,7 +128,7 @@ class TestCategoryRemoval:
         # When
         response = admin_client.delete(
             f"/tournaments/{tournament_id}/categories/{category_id}",
-            headers=htmx_headers(),
+            headers=_HTMX_HEADERS,
         )
 
         # Then - Should be forbidden (400 Bad Request with error message)
@@ -149,7 +138,7 @@ class TestCategoryRemoval:
 class TestCategoryDeletionCascade:
     """Test category deletion properly cascades to performers (BR-FIX-002)."""
 
-    def test_category_delete_cascades_to_performers(self, admin_client, create_e2e_tournament):
+    def test_category_delete_cascades_to_performers(self, admin_client, make_tournament):
         """Category deletion properly removes performers via ORM cascade.
 
         Validates: BR-FIX-002 - Category deletion CASCADE fix
@@ -161,24 +150,21 @@ class TestCategoryDeletionCascade:
             And the dancer can re-register in the same tournament
         """
         # Given - Tournament with category and performers
-        import asyncio
-        data = asyncio.get_event_loop().run_until_complete(
-            create_e2e_tournament(performers_per_category=3)
-        )
+        data = make_tournament(performers_per_category=3)
         tournament_id = data["tournament"].id
         category_id = data["categories"][0].id
 
         # When - Delete the category
         response = admin_client.delete(
             f"/tournaments/{tournament_id}/categories/{category_id}",
-            headers=htmx_headers(),
+            headers=_HTMX_HEADERS,
         )
 
         # Then - Should succeed (200)
         assert_status_ok(response)
 
     def test_tournament_detail_uses_styled_modal_for_category_removal(
-        self, admin_client, create_e2e_tournament
+        self, admin_client, make_tournament
     ):
         """Tournament detail uses styled modal instead of browser alert.
 
@@ -191,8 +177,7 @@ class TestCategoryDeletionCascade:
             And styled removal modals are included
         """
         # Given
-        import asyncio
-        data = asyncio.get_event_loop().run_until_complete(create_e2e_tournament())
+        data = make_tournament(performers_per_category=0)
         tournament_id = data["tournament"].id
 
         # When
@@ -252,7 +237,7 @@ class TestUserCreationModal:
                 "first_name": "Test",
                 "role": "invalid_role",
             },
-            headers=htmx_headers(),
+            headers=_HTMX_HEADERS,
         )
 
         # Then
@@ -291,7 +276,7 @@ class TestDancerCreationModal:
                 "date_of_birth": "not-a-date",
                 "blaze": "B-Boy Test",
             },
-            headers=htmx_headers(),
+            headers=_HTMX_HEADERS,
         )
 
         # Then
@@ -308,7 +293,7 @@ class TestPhaseAdvancement:
     """Test phase advancement UI and endpoint."""
 
     def test_tournament_detail_shows_advance_section_for_admin(
-        self, admin_client, create_e2e_tournament
+        self, admin_client, make_tournament
     ):
         """Tournament detail page shows phase advancement for admin.
 
@@ -320,8 +305,7 @@ class TestPhaseAdvancement:
             Then I see the phase advancement section
         """
         # Given
-        import asyncio
-        data = asyncio.get_event_loop().run_until_complete(create_e2e_tournament())
+        data = make_tournament(performers_per_category=0)
         tournament_id = data["tournament"].id
 
         # When
@@ -332,14 +316,13 @@ class TestPhaseAdvancement:
         # Check for phase advance UI elements
         assert "Phase Advancement" in response.text or "phase-advance" in response.text
 
-    def test_phase_advance_endpoint_exists(self, admin_client, create_e2e_tournament):
+    def test_phase_advance_endpoint_exists(self, admin_client, make_tournament):
         """POST /tournaments/{id}/advance endpoint exists.
 
         Validates: Issue #6 - Phase advancement endpoint
         """
         # Given
-        import asyncio
-        data = asyncio.get_event_loop().run_until_complete(create_e2e_tournament())
+        data = make_tournament(num_categories=0, performers_per_category=0)
         tournament_id = data["tournament"].id
 
         # When
@@ -360,13 +343,13 @@ class TestPhaseAdvancement:
 class TestModalHarmonization:
     """Test HTMX modal form submission pattern."""
 
-    def test_tournament_create_uses_htmx(self, staff_client):
+    def test_tournament_create_uses_htmx(self, tournaments_page):
         """Tournament create form uses HTMX.
 
         Validates: Issue #7 - Modal harmonization
         """
         # When
-        response = staff_client.get("/tournaments")
+        response = tournaments_page
 
         # Then - Check modal uses hx-post
         assert_status_ok(response)
@@ -385,7 +368,7 @@ class TestModalHarmonization:
         response = staff_client.post(
             "/tournaments/create",
             data={"name": f"Test Tournament {uuid4().hex[:8]}"},
-            headers=htmx_headers(),
+            headers=_HTMX_HEADERS,
         )
 
         # Then
@@ -396,37 +379,34 @@ class TestModalHarmonization:
 class TestRenameModal:
     """Test tournament rename modal functionality."""
 
-    def test_tournaments_page_includes_rename_modal(self, staff_client, create_e2e_tournament):
+    def test_tournaments_page_includes_rename_modal(self, tournaments_page):
         """Tournaments page includes rename modal.
 
         Validates: Issue #1 - Rename modal included
         """
-        # Given
-        import asyncio
-        asyncio.get_event_loop().run_until_complete(create_e2e_tournament())
+        # Given (shared tournament via tournaments_page fixture)
 
         # When
-        response = staff_client.get("/tournaments")
+        response = tournaments_page
 
         # Then
         assert_status_ok(response)
         assert 'id="rename-modal"' in response.text
 
-    def test_rename_endpoint_exists(self, staff_client, create_e2e_tournament):
+    def test_rename_endpoint_exists(self, staff_client, make_tournament):
         """POST /tournaments/{id}/rename endpoint exists.
 
         Validates: Issue #1 - Rename endpoint
         """
         # Given
-        import asyncio
-        data = asyncio.get_event_loop().run_until_complete(create_e2e_tournament())
+        data = make_tournament(num_categories=0, performers_per_category=0)
         tournament_id = data["tournament"].id
 
         # When
         response = staff_client.post(
             f"/tournaments/{tournament_id}/rename",
             data={"name": "Renamed Tournament"},
-            headers=htmx_headers(),
+            headers=_HTMX_HEADERS,
             follow_redirects=False,
         )
 
@@ -446,26 +426,26 @@ class TestCSSPatterns:
     Actual centering is verified visually or with browser testing tools.
     """
 
-    def test_modal_uses_dialog_element(self, staff_client):
+    def test_modal_uses_dialog_element(self, tournaments_page):
         """Modals use native <dialog> element.
 
         Validates: Issue #5 - Modal uses dialog for centering
         """
         # When
-        response = staff_client.get("/tournaments")
+        response = tournaments_page
 
         # Then
         assert_status_ok(response)
         assert "<dialog" in response.text
         assert 'class="modal"' in response.text
 
-    def test_empty_state_component_exists(self, staff_client, create_e2e_tournament):
+    def test_empty_state_component_exists(self, tournaments_page):
         """Empty state uses proper component structure.
 
         Validates: Issue #2 - Empty state component
         """
         # When - Get tournaments page (which may show empty state)
-        response = staff_client.get("/tournaments")
+        response = tournaments_page
 
         # Then - Should have empty-state CSS class available
         assert_status_ok(response)
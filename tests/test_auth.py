@@ -1,69 +1,86 @@
 """Tests for authentication system."""
+import time
+
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient, ASGITransport
 from app.main import app
+from itsdangerous.timed import TimestampSigner
 from app.auth import magic_link_auth
 from app.config import settings
 from app.services.email.service import EmailService
-from app.services.email.provider import BaseEmailProvider
 from app.dependencies import get_email_service
 from app.db.database import get_db
 # Use isolated test database - NEVER import from app.db.database!
-from tests.conftest import test_session_maker
-from app.repositories.user import UserRepository
-from app.models.user import UserRole
+from tests.conftest import session_cookie, test_session_maker
+from app.models.user import User, UserRole
 
 
-class MockEmailProvider(BaseEmailProvider):
-    """Mock email provider for testing.
+async def _create_auth_test_users():
+    """Insert the admin, staff and mc users used by the auth tests."""
+    async with test_session_maker() as session:
+        # One flush for all rows instead of a flush + refresh per create_user()
+        session.add_all([
+            User(email="admin@battle-d.com", first_name="Admin", role=UserRole.ADMIN),
+            User(email="staff@battle-d.com", first_name="Staff", role=UserRole.STAFF),
+            User(email="mc@battle-d.com", first_name="MC", role=UserRole.MC),
+        ])
+        await session.commit()
 
-    Stores sent emails in memory instead of actually sending them.
-    """
 
-    def __init__(self):
-        self.sent_emails = []
+@pytest.fixture(scope="module", autouse=True)
+def setup_auth_test_users(db_event_loop, test_db_connection):
+    """Create test users for auth tests.
 
-    async def send_magic_link(
-        self, to_email: str, magic_link: str, first_name: str
-    ) -> bool:
-        """Mock email sending - just store the email data."""
-        self.sent_emails.append(
-            {"to_email": to_email, "magic_link": magic_link, "first_name": first_name}
-        )
-        return True
+    Note: Database setup is handled by conftest.py fixture.
+    Users are seeded once per module inside the module transaction; each
+    test's SAVEPOINT rollback undoes any changes it makes to them.
+    """
+    db_event_loop.run_until_complete(_create_auth_test_users())
 
-    def clear(self):
-        """Clear sent emails list."""
-        self.sent_emails = []
 
+@pytest.fixture(scope="module")
+def admin_token():
+    """Magic link token for admin@battle-d.com, signed once per module."""
+    return magic_link_auth.generate_token("admin@battle-d.com", "admin")
 
-@pytest.fixture
-def mock_email_provider():
-    """Create mock email provider for testing."""
-    return MockEmailProvider()
 
+@pytest.fixture(scope="module")
+def staff_token():
+    """Magic link token for staff@battle-d.com, signed once per module."""
+    return magic_link_auth.generate_token("staff@battle-d.com", "staff")
 
-@pytest.fixture(scope="function", autouse=True)
-async def setup_auth_test_users():
-    """Create test users for auth tests.
 
-    Note: Database setup is handled by conftest.py fixture.
-    This fixture only creates the test users needed for auth tests.
+async def _login(token):
+    """Verify a magic link token and return the session cookie it sets.
+
+    /auth/verify only checks the token signature, so no database override
+    is needed.
     """
-    # Create test users
-    async with test_session_maker() as session:
-        user_repo = UserRepository(session)
-        await user_repo.create_user("admin@battle-d.com", "Admin", UserRole.ADMIN)
-        await user_repo.create_user("staff@battle-d.com", "Staff", UserRole.STAFF)
-        await user_repo.create_user("mc@battle-d.com", "MC", UserRole.MC)
-        await session.commit()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as login_client:
+        return session_cookie(await login_client.get(f"/auth/verify?token={token}"))
+
 
-    yield
+@pytest.fixture(scope="module")
+def admin_session_cookie(db_event_loop, admin_token):
+    """Session cookie for admin@battle-d.com, logged in once per module."""
+    return db_event_loop.run_until_complete(_login(admin_token))
+
+
+@pytest.fixture(scope="module")
+def staff_session_cookie(db_event_loop, staff_token):
+    """Session cookie for staff@battle-d.com, logged in once per module."""
+    return db_event_loop.run_until_complete(_login(staff_token))
 
 
 @pytest.fixture
-def client(mock_email_provider):
-    """Create test client with mock email provider and isolated test database."""
+async def client(mock_email_provider):
+    """Create async test client with mock email provider and isolated test database.
+
+    httpx.AsyncClient over ASGITransport calls the app directly on the
+    test's event loop, without TestClient's portal thread per request.
+    Redirects are not followed (httpx default).
+    """
 
     def get_mock_email_service():
         return EmailService(mock_email_provider)
@@ -84,7 +101,11 @@ def client(mock_email_provider):
     app.dependency_overrides[get_email_service] = get_mock_email_service
     app.dependency_overrides[get_db] = get_test_db
 
-    with TestClient(app) as test_client:
+    transport = ASGITransport(app=app)
+    # Redirects are not followed, so tests see the 30x status and location
+    async with AsyncClient(
+        transport=transport, base_url="http://test", follow_redirects=False
+    ) as test_client:
         yield test_client
 
     # Clean up after test
@@ -116,13 +137,14 @@ class TestMagicLinkAuth:
         payload = magic_link_auth.verify_token("invalid-token")
         assert payload is None
 
-    def test_verify_expired_token(self):
+    def test_verify_expired_token(self, monkeypatch):
         """Test verifying an expired token."""
-        import time
+        # Sign the token 2 seconds in the past, then verify with max_age=1
+        issued_at = int(time.time()) - 2
+        with monkeypatch.context() as m:
+            m.setattr(TimestampSigner, "get_timestamp", lambda self: issued_at)
+            token = magic_link_auth.generate_token("test@example.com", "admin")
 
-        token = magic_link_auth.generate_token("test@example.com", "admin")
-        # Wait 2 seconds, then verify with max_age=1 to simulate expiration
-        time.sleep(2)
         payload = magic_link_auth.verify_token(token, max_age=1)
         assert payload is None
 
@@ -137,54 +159,46 @@ class TestMagicLinkAuth:
 class TestAuthRoutes:
     """Tests for authentication routes."""
 
-    def test_login_page(self, client):
+    async def test_login_page(self, client):
         """Test login page is accessible."""
-        response = client.get("/auth/login")
+        response = await client.get("/auth/login")
         assert response.status_code == 200
         assert b"Login" in response.content
         assert b"email" in response.content.lower()
 
-    def test_send_magic_link_existing_user(self, client):
+    async def test_send_magic_link_existing_user(self, client):
         """Test sending magic link to existing user.
 
         Note: Email sending happens in background task after response.
         The email provider logic is tested separately in provider-specific tests.
         Routes now return redirects with flash messages instead of JSON.
         """
-        response = client.post(
+        response = await client.post(
             "/auth/send-magic-link",
             data={"email": "admin@battle-d.com"},
-            follow_redirects=False,
         )
         # Now returns redirect with flash message
         assert response.status_code == 303
         assert response.headers["location"] == "/auth/login"
 
-    def test_send_magic_link_nonexistent_user(self, client):
+    async def test_send_magic_link_nonexistent_user(self, client):
         """Test sending magic link to non-existent user (same response for security).
 
         Note: No email is sent for non-existent users, but the response
         is intentionally the same to prevent user enumeration.
         Routes now return redirects with flash messages instead of JSON.
         """
-        response = client.post(
+        response = await client.post(
             "/auth/send-magic-link",
             data={"email": "nonexistent@example.com"},
-            follow_redirects=False,
         )
         # Same redirect for security (prevent user enumeration)
         assert response.status_code == 303
         assert response.headers["location"] == "/auth/login"
 
-    def test_verify_valid_magic_link(self, client):
+    async def test_verify_valid_magic_link(self, client, admin_token):
         """Test verifying a valid magic link."""
-        # Generate a token for existing user
-        token = magic_link_auth.generate_token("admin@battle-d.com", "admin")
-
-        response = client.get(
-            f"/auth/verify?token={token}",
-            follow_redirects=False,
-        )
+        response = await client.get(f"/auth/verify?token={admin_token}")
 
         assert response.status_code == 303  # Redirect
         assert response.headers["location"] == "/tournaments"
@@ -193,54 +207,39 @@ class TestAuthRoutes:
         cookies = response.cookies
         assert settings.SESSION_COOKIE_NAME in cookies
 
-    def test_verify_invalid_magic_link(self, client):
+    async def test_verify_invalid_magic_link(self, client):
         """Test verifying an invalid magic link.
 
         Routes now return redirects with flash messages instead of HTTP error codes.
         """
-        response = client.get("/auth/verify?token=invalid-token", follow_redirects=False)
+        response = await client.get("/auth/verify?token=invalid-token")
         # Now returns redirect to login with error flash message
         assert response.status_code == 303
         assert response.headers["location"] == "/auth/login"
 
-    def test_logout(self, client):
+    async def test_logout(self, client, admin_token):
         """Test logout clears session."""
         # First login
-        token = magic_link_auth.generate_token("admin@battle-d.com", "admin")
-        client.get(f"/auth/verify?token={token}")
+        await client.get(f"/auth/verify?token={admin_token}")
 
         # Then logout
-        response = client.get("/auth/logout", follow_redirects=False)
+        response = await client.get("/auth/logout")
         assert response.status_code == 303
         assert response.headers["location"] == "/auth/login"
 
-    def test_dashboard_requires_auth(self, client):
+    async def test_dashboard_requires_auth(self, client):
         """Test dashboard requires authentication."""
-        response = client.get("/dashboard")
+        # /dashboard permanently redirects to /tournaments, which requires auth
+        response = await client.get("/dashboard", follow_redirects=True)
         assert response.status_code == 401
 
-    def test_overview_redirects_to_tournaments(self, client):
+    async def test_overview_redirects_to_tournaments(self, client, admin_session_cookie):
         """Test /overview redirects to /tournaments (dashboard removed)."""
-        # Login first
-        token = magic_link_auth.generate_token("admin@battle-d.com", "admin")
-        login_response = client.get(f"/auth/verify?token={token}", follow_redirects=False)
-
-        # Extract session cookie from Set-Cookie header
-        set_cookie_header = login_response.headers.get("set-cookie", "")
-        assert settings.SESSION_COOKIE_NAME in set_cookie_header
-
-        # Parse cookie value
-        cookie_start = set_cookie_header.find(f"{settings.SESSION_COOKIE_NAME}=") + len(
-            f"{settings.SESSION_COOKIE_NAME}="
-        )
-        cookie_end = set_cookie_header.find(";", cookie_start)
-        session_cookie = set_cookie_header[cookie_start:cookie_end]
+        # Logged in as admin
+        client.cookies.set(settings.SESSION_COOKIE_NAME, admin_session_cookie)
 
         # Access /overview - should redirect to /tournaments
-        response = client.get(
-            "/overview", cookies={settings.SESSION_COOKIE_NAME: session_cookie},
-            follow_redirects=False
-        )
+        response = await client.get("/overview")
         assert response.status_code == 302
         assert response.headers["location"] == "/tournaments"
 
@@ -248,31 +247,18 @@ class TestAuthRoutes:
 class TestSessionManagement:
     """Tests for session management."""
 
-    def test_session_persists_across_requests(self, client):
+    async def test_session_persists_across_requests(self, client, staff_session_cookie):
         """Test session cookie works across multiple requests."""
-        # Login
-        token = magic_link_auth.generate_token("staff@battle-d.com", "staff")
-        login_response = client.get(f"/auth/verify?token={token}", follow_redirects=False)
-
-        # Extract session cookie from Set-Cookie header
-        set_cookie_header = login_response.headers.get("set-cookie", "")
-        cookie_start = set_cookie_header.find(f"{settings.SESSION_COOKIE_NAME}=") + len(
-            f"{settings.SESSION_COOKIE_NAME}="
-        )
-        cookie_end = set_cookie_header.find(";", cookie_start)
-        session_cookie = set_cookie_header[cookie_start:cookie_end]
+        # Logged in as staff
+        client.cookies.set(settings.SESSION_COOKIE_NAME, staff_session_cookie)
 
         # Make multiple requests with same session (use /tournaments instead of /overview)
-        for _ in range(3):
-            response = client.get(
-                "/tournaments", cookies={settings.SESSION_COOKIE_NAME: session_cookie}
-            )
-            assert response.status_code == 200
+        codes = [(await client.get("/tournaments")).status_code for _ in range(3)]
+        assert codes == [200, 200, 200]
 
-    def test_invalid_session_rejected(self, client):
+    async def test_invalid_session_rejected(self, client):
         """Test invalid session is rejected."""
-        response = client.get(
-            "/tournaments",
-            cookies={settings.SESSION_COOKIE_NAME: "invalid-session"},
-        )
+        client.cookies.set(settings.SESSION_COOKIE_NAME, "invalid-session")
+
+        response = await client.get("/tournaments")
         assert response.status_code == 401
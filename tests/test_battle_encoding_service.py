@@ -12,49 +12,37 @@ Test Categories:
 - Battle not found handling
 """
 
+import itertools
 import pytest
 import uuid
+from contextlib import asynccontextmanager
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 from app.models.battle import Battle, BattlePhase, BattleStatus, BattleOutcomeType
 from app.models.performer import Performer
 from app.models.dancer import Dancer
 from app.services.battle_results_encoding_service import BattleResultsEncodingService
-from app.repositories.battle import BattleRepository
-from app.repositories.performer import PerformerRepository
 
 
 # ==================== Fixtures ====================
 
+@asynccontextmanager
+async def _noop_begin():
+    """Stand-in for AsyncSession.begin() that opens no transaction."""
+    yield
+
+
 @pytest.fixture
 def mock_session():
     """Mock database session."""
-    from contextlib import asynccontextmanager
-
     session = AsyncMock()
-
-    @asynccontextmanager
-    async def mock_begin():
-        yield
-
-    session.begin = mock_begin
+    session.begin = _noop_begin
     session.refresh = AsyncMock()
     return session
 
 
-@pytest.fixture
-def battle_repo():
-    """Mock battle repository."""
-    return AsyncMock(spec=BattleRepository)
-
-
-@pytest.fixture
-def performer_repo():
-    """Mock performer repository."""
-    return AsyncMock(spec=PerformerRepository)
-
-
 @pytest.fixture
 def encoding_service(mock_session, battle_repo, performer_repo):
     """Battle results encoding service with mocked dependencies."""
@@ -63,40 +51,49 @@ def encoding_service(mock_session, battle_repo, performer_repo):
 
 # ==================== Helper Functions ====================
 
-def create_test_battle(phase: BattlePhase, status: BattleStatus, num_performers: int = 2):
-    """Create a mock battle with performers."""
-    from unittest.mock import MagicMock
-
-    battle = MagicMock()
-    battle.id = uuid.uuid4()
-    battle.category_id = uuid.uuid4()
-    battle.phase = phase
-    battle.status = status
-    battle.outcome_type = BattleOutcomeType.SCORED if phase == BattlePhase.PRESELECTION else BattleOutcomeType.WIN_DRAW_LOSS
-    battle.outcome = None
-    battle.winner_id = None
-
-    # Create mock performers
-    battle.performers = []
-    for i in range(num_performers):
-        dancer = MagicMock()
-        dancer.id = uuid.uuid4()
-        dancer.dancer_name = f"Dancer{i}"
-        dancer.email = f"dancer{i}@test.com"
+_uid_counter = itertools.count(1)
 
-        performer = MagicMock()
-        performer.id = uuid.uuid4()
-        performer.dancer_id = dancer.id
-        performer.category_id = battle.category_id
-        performer.dancer = dancer
-        performer.pool_wins = 0
-        performer.pool_losses = 0
-        performer.pool_draws = 0
-        performer.preselection_score = None
 
-        battle.performers.append(performer)
+def _uid() -> uuid.UUID:
+    """Return a distinct UUID (tests only need uniqueness, not randomness)."""
+    return uuid.UUID(int=next(_uid_counter))
 
-    return battle
+
+def create_test_battle(phase: BattlePhase, status: BattleStatus, num_performers: int = 2):
+    """Create a stand-in battle with performers.
+
+    The service only reads and sets attributes on these objects, so plain
+    namespaces are used instead of MagicMock.
+    """
+    category_id = _uid()
+    performers = []
+    for i in range(num_performers):
+        dancer = SimpleNamespace(
+            id=_uid(),
+            dancer_name=f"Dancer{i}",
+            email=f"dancer{i}@test.com",
+        )
+        performers.append(SimpleNamespace(
+            id=_uid(),
+            dancer_id=dancer.id,
+            category_id=category_id,
+            dancer=dancer,
+            pool_wins=0,
+            pool_losses=0,
+            pool_draws=0,
+            preselection_score=None,
+        ))
+
+    return SimpleNamespace(
+        id=_uid(),
+        category_id=category_id,
+        phase=phase,
+        status=status,
+        outcome_type=BattleOutcomeType.SCORED if phase == BattlePhase.PRESELECTION else BattleOutcomeType.WIN_DRAW_LOSS,
+        outcome=None,
+        winner_id=None,
+        performers=performers,
+    )
 
 
 # ==================== Preselection Tests ====================
@@ -107,8 +104,6 @@ async def test_encode_preselection_battle_success(encoding_service, battle_repo,
     # Setup
     battle = create_test_battle(BattlePhase.PRESELECTION, BattleStatus.ACTIVE, 2)
     battle_repo.get_with_performers.return_value = battle
-    battle_repo.update = AsyncMock()
-    performer_repo.update = AsyncMock()
 
     # Encode
     scores = {
@@ -121,35 +116,54 @@ async def test_encode_preselection_battle_success(encoding_service, battle_repo,
     assert result.valid
     assert len(result.errors) == 0
     battle_repo.update.assert_called_once()
-    assert performer_repo.update.call_count == 2
+    performer_repo.bulk_update.assert_called_once_with({
+        battle.performers[0].id: {"preselection_score": Decimal("8.5")},
+        battle.performers[1].id: {"preselection_score": Decimal("9.0")},
+    })
 
 
 @pytest.mark.asyncio
-async def test_encode_preselection_missing_scores(encoding_service, battle_repo):
-    """Test preselection fails when scores missing."""
-    battle = create_test_battle(BattlePhase.PRESELECTION, BattleStatus.ACTIVE, 2)
+@pytest.mark.parametrize(
+    "phase,num_performers,score,expected_error",
+    [
+        # Missing one performer's score
+        (BattlePhase.PRESELECTION, 2, Decimal("8.5"), "missing scores"),
+        # Score out of range
+        (BattlePhase.PRESELECTION, 1, Decimal("15.0"), "out of range"),
+        # FINALS battle encoded as preselection
+        (BattlePhase.FINALS, 2, Decimal("8.5"), "expected preselection"),
+    ],
+    ids=["missing_scores", "score_out_of_range", "wrong_phase"],
+)
+async def test_encode_preselection_fails(
+    encoding_service, battle_repo, phase, num_performers, score, expected_error
+):
+    """Test preselection encoding rejects invalid input."""
+    battle = create_test_battle(phase, BattleStatus.ACTIVE, num_performers)
     battle_repo.get_with_performers.return_value = battle
 
-    # Missing one performer's score
-    scores = {battle.performers[0].id: Decimal("8.5")}
+    # Only the first performer is scored
+    scores = {battle.performers[0].id: score}
     result = await encoding_service.encode_preselection_results(battle.id, scores)
 
     assert not result.valid
-    assert "Missing scores" in result.errors[0]
+    assert expected_error in result.errors[0].lower()
 
 
 @pytest.mark.asyncio
-async def test_encode_preselection_invalid_score_range(encoding_service, battle_repo):
-    """Test preselection fails for invalid score range."""
-    battle = create_test_battle(BattlePhase.PRESELECTION, BattleStatus.ACTIVE, 1)
+async def test_encode_preselection_score_bounds_inclusive(encoding_service, battle_repo, performer_repo):
+    """Test preselection accepts scores at exactly 0.0 and 10.0."""
+    battle = create_test_battle(BattlePhase.PRESELECTION, BattleStatus.ACTIVE, 2)
     battle_repo.get_with_performers.return_value = battle
 
-    # Score out of range
-    scores = {battle.performers[0].id: Decimal("15.0")}
+    scores = {
+        battle.performers[0].id: Decimal("0.0"),
+        battle.performers[1].id: Decimal("10.0"),
+    }
     result = await encoding_service.encode_preselection_results(battle.id, scores)
 
-    assert not result.valid
-    assert "out of range" in result.errors[0].lower()
+    assert result.valid
+    assert len(result.errors) == 0
 
 
 # ==================== Pool Tests ====================
@@ -159,15 +173,16 @@ async def test_encode_pool_with_winner(encoding_service, battle_repo, performer_
     """Test pool encoding with winner."""
     battle = create_test_battle(BattlePhase.POOLS, BattleStatus.ACTIVE, 2)
     battle_repo.get_with_performers.return_value = battle
-    battle_repo.update = AsyncMock()
-    performer_repo.update = AsyncMock()
 
     winner_id = battle.performers[0].id
     result = await encoding_service.encode_pool_results(battle.id, winner_id, is_draw=False)
 
     assert result.valid
     battle_repo.update.assert_called_once()
-    assert performer_repo.update.call_count == 2  # Update both performers
+    performer_repo.bulk_update.assert_called_once_with({
+        winner_id: {"pool_wins": 1},
+        battle.performers[1].id: {"pool_losses": 1},
+    })
 
 
 @pytest.mark.asyncio
@@ -175,14 +190,15 @@ async def test_encode_pool_with_draw(encoding_service, battle_repo, performer_re
     """Test pool encoding with draw."""
     battle = create_test_battle(BattlePhase.POOLS, BattleStatus.ACTIVE, 2)
     battle_repo.get_with_performers.return_value = battle
-    battle_repo.update = AsyncMock()
-    performer_repo.update = AsyncMock()
 
     result = await encoding_service.encode_pool_results(battle.id, winner_id=None, is_draw=True)
 
     assert result.valid
     battle_repo.update.assert_called_once()
-    assert performer_repo.update.call_count == 2  # Both get draw
+    performer_repo.bulk_update.assert_called_once_with({
+        battle.performers[0].id: {"pool_draws": 1},
+        battle.performers[1].id: {"pool_draws": 1},
+    })
 
 
 @pytest.mark.asyncio
@@ -209,7 +225,6 @@ async def test_encode_tiebreak_success(encoding_service, battle_repo):
     """Test tiebreak encoding."""
     battle = create_test_battle(BattlePhase.TIEBREAK, BattleStatus.ACTIVE, 2)
     battle_repo.get_with_performers.return_value = battle
-    battle_repo.update = AsyncMock()
 
     winner_id = battle.performers[0].id
     result = await encoding_service.encode_tiebreak_results(battle.id, winner_id)
@@ -225,7 +240,7 @@ async def test_encode_tiebreak_no_draws_allowed(encoding_service, battle_repo):
     battle_repo.get_with_performers.return_value = battle
 
     # Winner ID is required
-    fake_winner = uuid.uuid4()  # Not in battle
+    fake_winner = _uid()  # Not in battle
     result = await encoding_service.encode_tiebreak_results(battle.id, fake_winner)
 
     assert not result.valid
@@ -238,7 +253,6 @@ async def test_encode_finals_success(encoding_service, battle_repo):
     """Test finals encoding."""
     battle = create_test_battle(BattlePhase.FINALS, BattleStatus.ACTIVE, 3)
     battle_repo.get_with_performers.return_value = battle
-    battle_repo.update = AsyncMock()
 
     winner_id = battle.performers[0].id
     result = await encoding_service.encode_finals_results(battle.id, winner_id)
@@ -254,27 +268,13 @@ async def test_encode_battle_not_found(encoding_service, battle_repo):
     """Test encoding fails for non-existent battle."""
     battle_repo.get_with_performers.return_value = None
 
-    fake_id = uuid.uuid4()
+    fake_id = _uid()
     result = await encoding_service.encode_preselection_results(fake_id, {})
 
     assert not result.valid
     assert "not found" in result.errors[0].lower()
 
 
-@pytest.mark.asyncio
-async def test_encode_wrong_phase_fails(encoding_service, battle_repo):
-    """Test encoding fails for wrong phase."""
-    # Try to encode FINALS battle as preselection
-    battle = create_test_battle(BattlePhase.FINALS, BattleStatus.ACTIVE, 2)
-    battle_repo.get_with_performers.return_value = battle
-
-    scores = {battle.performers[0].id: Decimal("8.5")}
-    result = await encoding_service.encode_preselection_results(battle.id, scores)
-
-    assert not result.valid
-    assert "PRESELECTION" in result.errors[0]
-
-
 # ==================== Single Performer Tests ====================
 
 @pytest.mark.asyncio
@@ -282,8 +282,6 @@ async def test_encode_single_performer_preselection(encoding_service, battle_rep
     """Test encoding preselection with single performer."""
     battle = create_test_battle(BattlePhase.PRESELECTION, BattleStatus.ACTIVE, 1)
     battle_repo.get_with_performers.return_value = battle
-    battle_repo.update = AsyncMock()
-    performer_repo.update = AsyncMock()
 
     scores = {battle.performers[0].id: Decimal("7.5")}
     result = await encoding_service.encode_preselection_results(battle.id, scores)
@@ -23,6 +23,17 @@ from app.repositories.battle import BattleRepository
 from app.services.battle_results_encoding_service import BattleResultsEncodingService
 from app.models.battle import Battle, BattlePhase, BattleStatus, BattleOutcomeType
 
+# Date of birth shared by all test dancers (date is immutable)
+_DEFAULT_DOB = date(2000, 1, 1)
+
+# Outcome type each battle phase is created with
+_PHASE_OUTCOME_MAP = {
+    BattlePhase.PRESELECTION: BattleOutcomeType.SCORED,
+    BattlePhase.POOLS: BattleOutcomeType.WIN_DRAW_LOSS,
+    BattlePhase.TIEBREAK: BattleOutcomeType.TIEBREAK,
+    BattlePhase.FINALS: BattleOutcomeType.WIN_LOSS,
+}
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -36,7 +47,7 @@ async def create_dancer(session, email: str, blaze: str):
         email=email,
         first_name="Test",
         last_name="Dancer",
-        date_of_birth=date(2000, 1, 1),
+        date_of_birth=_DEFAULT_DOB,
         blaze=blaze,
     )
 
@@ -75,15 +86,7 @@ async def create_battle_with_performers(session, category_id, phase, performers)
     """Helper to create a battle with performers for tests."""
     battle_repo = BattleRepository(session)
 
-    # Determine outcome type based on phase
-    if phase == BattlePhase.PRESELECTION:
-        outcome_type = BattleOutcomeType.SCORED
-    elif phase == BattlePhase.POOLS:
-        outcome_type = BattleOutcomeType.WIN_DRAW_LOSS
-    elif phase == BattlePhase.TIEBREAK:
-        outcome_type = BattleOutcomeType.TIEBREAK
-    else:
-        outcome_type = BattleOutcomeType.WIN_LOSS
+    outcome_type = _PHASE_OUTCOME_MAP[phase]
 
     # Create battle using create_battle method
     performer_ids = [p.id for p in performers]
@@ -102,7 +105,7 @@ async def create_battle_with_performers(session, category_id, phase, performers)
 
 
 # =============================================================================
-# PRESELECTION ENCODING TESTS
+# BATTLE NOT FOUND TESTS
 # =============================================================================
 
 # Note: Full encoding integration tests are skipped due to transaction management
@@ -115,102 +118,27 @@ async def create_battle_with_performers(session, category_id, phase, performers)
 
 
 @pytest.mark.asyncio
-async def test_encode_preselection_battle_not_found():
-    """Test preselection encoding with non-existent battle."""
-    async with test_session_maker() as session:
-        battle_repo = BattleRepository(session)
-        performer_repo = PerformerRepository(session)
-
-        service = BattleResultsEncodingService(session, battle_repo, performer_repo)
-
-        fake_battle_id = uuid4()
-        result = await service.encode_preselection_results(fake_battle_id, {})
-
-        assert not result.valid
-        assert "not found" in result.errors[0].lower()
-
-
-# =============================================================================
-# POOL ENCODING TESTS
-# =============================================================================
-
-
-@pytest.mark.asyncio
-async def test_encode_pool_battle_not_found():
-    """Test pool encoding with non-existent battle."""
-    async with test_session_maker() as session:
-        battle_repo = BattleRepository(session)
-        performer_repo = PerformerRepository(session)
-
-        service = BattleResultsEncodingService(session, battle_repo, performer_repo)
-
-        fake_battle_id = uuid4()
-        result = await service.encode_pool_results(fake_battle_id, winner_id=None, is_draw=True)
-
-        assert not result.valid
-        assert "not found" in result.errors[0].lower()
-
-
-# =============================================================================
-# TIEBREAK ENCODING TESTS
-# =============================================================================
-
-
-@pytest.mark.asyncio
-async def test_encode_tiebreak_battle_not_found():
-    """Test tiebreak encoding with non-existent battle."""
-    async with test_session_maker() as session:
-        battle_repo = BattleRepository(session)
-        performer_repo = PerformerRepository(session)
-
-        service = BattleResultsEncodingService(session, battle_repo, performer_repo)
-
-        fake_battle_id = uuid4()
-        fake_winner_id = uuid4()
-        result = await service.encode_tiebreak_results(fake_battle_id, fake_winner_id)
-
-        assert not result.valid
-        assert "not found" in result.errors[0].lower()
-
-
-# =============================================================================
-# FINALS ENCODING TESTS
-# =============================================================================
-
-
-@pytest.mark.asyncio
-async def test_encode_finals_battle_not_found():
-    """Test finals encoding with non-existent battle."""
-    async with test_session_maker() as session:
-        battle_repo = BattleRepository(session)
-        performer_repo = PerformerRepository(session)
-
-        service = BattleResultsEncodingService(session, battle_repo, performer_repo)
-
-        fake_battle_id = uuid4()
-        fake_winner_id = uuid4()
-        result = await service.encode_finals_results(fake_battle_id, fake_winner_id)
-
-        assert not result.valid
-        assert "not found" in result.errors[0].lower()
-
-
-# =============================================================================
-# GENERIC ROUTING TESTS
-# =============================================================================
-
-
-@pytest.mark.asyncio
-async def test_encode_battle_results_battle_not_found():
-    """Test generic encoder handles non-existent battle."""
+@pytest.mark.parametrize(
+    "method,args,kwargs",
+    [
+        ("encode_preselection_results", (uuid4(), {}), {}),
+        ("encode_pool_results", (uuid4(),), {"winner_id": None, "is_draw": True}),
+        ("encode_tiebreak_results", (uuid4(), uuid4()), {}),
+        ("encode_finals_results", (uuid4(), uuid4()), {}),
+        # Generic router
+        ("encode_battle_results", (uuid4(),), {"winner_id": uuid4()}),
+    ],
+    ids=["preselection", "pool", "tiebreak", "finals", "generic"],
+)
+async def test_encode_battle_not_found(method, args, kwargs):
+    """Test each encoder rejects a non-existent battle."""
     async with test_session_maker() as session:
         battle_repo = BattleRepository(session)
         performer_repo = PerformerRepository(session)
 
         service = BattleResultsEncodingService(session, battle_repo, performer_repo)
 
-        fake_battle_id = uuid4()
-        result = await service.encode_battle_results(fake_battle_id, winner_id=uuid4())
+        result = await getattr(service, method)(*args, **kwargs)
 
         assert not result.valid
         assert "not found" in result.errors[0].lower()
@@ -3,6 +3,7 @@
 Tests battle generation, lifecycle management, and queue operations.
 See: ROADMAP.md §2.1 Battle Generation Services
 """
+import itertools
 import pytest
 import uuid
 from typing import List
@@ -13,24 +14,26 @@ from app.models.battle import Battle, BattlePhase, BattleStatus, BattleOutcomeTy
 from app.models.category import Category
 from app.models.performer import Performer
 from app.models.pool import Pool
-from app.repositories.battle import BattleRepository
-from app.repositories.performer import PerformerRepository
 from app.repositories.category import CategoryRepository
 from app.services.battle_service import BattleService
 
 
-@pytest.fixture
-def battle_repo():
-    """Mock battle repository."""
-    repo = AsyncMock(spec=BattleRepository)
-    repo.session = MagicMock()
-    return repo
+_uid_counter = itertools.count(1)
+
+
+def _uid() -> uuid.UUID:
+    """Return a distinct UUID (tests only need uniqueness, not randomness)."""
+    return uuid.UUID(int=next(_uid_counter))
 
 
 @pytest.fixture
-def performer_repo():
-    """Mock performer repository."""
-    return AsyncMock(spec=PerformerRepository)
+def battle_repo(battle_repo):
+    """Shared battle repository mock with a session for CategoryRepository."""
+    battle_repo.session = MagicMock()
+    return battle_repo
+
+
+# performer_repo: shared spec'd mock from tests/conftest.py
 
 
 @pytest.fixture
@@ -39,38 +42,45 @@ def battle_service(battle_repo, performer_repo):
     return BattleService(battle_repo, performer_repo)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tournament_id():
     """Sample tournament UUID."""
-    return uuid.uuid4()
+    return _uid()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def category_id():
     """Sample category UUID."""
-    return uuid.uuid4()
+    return _uid()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pool_id():
     """Sample pool UUID."""
-    return uuid.uuid4()
+    return _uid()
 
 
 def create_performer(
     tournament_id: uuid.UUID, category_id: uuid.UUID, name: str = "Performer"
 ) -> Performer:
     """Helper to create a performer."""
-    dancer_id = uuid.uuid4()
+    dancer_id = _uid()
     performer = Performer(
         tournament_id=tournament_id,
         category_id=category_id,
         dancer_id=dancer_id,
     )
-    performer.id = uuid.uuid4()
+    performer.id = _uid()
     return performer
 
 
+def create_performers(
+    tournament_id: uuid.UUID, category_id: uuid.UUID, count: int
+) -> List[Performer]:
+    """Helper to create several performers in one category."""
+    return [create_performer(tournament_id, category_id) for _ in range(count)]
+
+
 def create_battle(
     category_id: uuid.UUID,
     phase: BattlePhase,
@@ -85,113 +95,65 @@ def create_battle(
         status=status,
         outcome_type=outcome_type,
     )
-    battle.id = uuid.uuid4()
+    battle.id = _uid()
     if performers:
         battle.performers = performers
     return battle
 
 
+def assign_battle_id(battle: Battle) -> Battle:
+    """Side effect for battle_repo.create: assign an id and return the battle."""
+    battle.id = _uid()
+    return battle
+
+
+def apply_status_update(battle: Battle):
+    """Build a battle_repo.update side effect that applies status to battle."""
+    def update(battle_id, **kwargs):
+        battle.status = kwargs.get("status", battle.status)
+        return battle
+    return update
+
+
 class TestGeneratePreselectionBattles:
     """Tests for preselection battle generation."""
 
-    async def test_even_number_of_performers(
-        self, battle_service, performer_repo, battle_repo, tournament_id, category_id
+    @pytest.mark.parametrize(
+        "num_performers,expected_sizes",
+        [
+            (4, [2, 2]),  # Even: all 1v1
+            (5, [2, 3]),  # Odd: one 1v1, one 3-way
+            (3, [3]),  # Exactly 3: one 3-way
+        ],
+        ids=["even", "odd", "three_only"],
+    )
+    async def test_preselection_battle_sizes(
+        self, battle_service, performer_repo, battle_repo, tournament_id, category_id,
+        num_performers, expected_sizes,
     ):
-        """Test preselection generation with even number of performers."""
-        # Setup: 4 performers
-        performers = [
-            create_performer(tournament_id, category_id, f"Performer{i}")
-            for i in range(4)
-        ]
+        """Test preselection generation splits performers into 1v1s and one 3-way if odd."""
+        # Setup
+        performers = create_performers(tournament_id, category_id, num_performers)
         # Mock both methods - get_regular_performers for battle generation,
         # get_by_category for validation (checking if any performers exist)
         performer_repo.get_regular_performers.return_value = performers
         performer_repo.get_by_category.return_value = performers
-
-        # Mock battle creation - return a battle with assigned performers
-        def create_battle_mock(battle):
-            battle.id = uuid.uuid4()
-            return battle
-
-        battle_repo.create.side_effect = create_battle_mock
+        battle_repo.create.side_effect = assign_battle_id
 
         # Execute
         battles = await battle_service.generate_preselection_battles(category_id)
 
-        # Verify: 2 battles created (4 performers / 2)
-        assert len(battles) == 2
-        assert all(len(b.performers) == 2 for b in battles)
-        assert all(b.phase == BattlePhase.PRESELECTION for b in battles)
-        assert all(b.status == BattleStatus.PENDING for b in battles)
-        assert all(b.outcome_type == BattleOutcomeType.SCORED for b in battles)
+        # Verify battle sizes
+        assert sorted(len(b.performers) for b in battles) == expected_sizes
+        assert {b.phase for b in battles} == {BattlePhase.PRESELECTION}
+        assert {b.status for b in battles} == {BattleStatus.PENDING}
+        assert {b.outcome_type for b in battles} == {BattleOutcomeType.SCORED}
 
         # Verify all performers are included exactly once
-        all_battle_performers = []
-        for battle in battles:
-            all_battle_performers.extend(battle.performers)
-        assert len(all_battle_performers) == 4
+        all_battle_performers = list(itertools.chain.from_iterable(b.performers for b in battles))
+        assert len(all_battle_performers) == num_performers
         assert set(all_battle_performers) == set(performers)
 
-    async def test_odd_number_of_performers(
-        self, battle_service, performer_repo, battle_repo, tournament_id, category_id
-    ):
-        """Test preselection generation with odd number of performers."""
-        # Setup: 5 performers
-        performers = [
-            create_performer(tournament_id, category_id, f"Performer{i}")
-            for i in range(5)
-        ]
-        performer_repo.get_regular_performers.return_value = performers
-        performer_repo.get_by_category.return_value = performers
-
-        def create_battle_mock(battle):
-            battle.id = uuid.uuid4()
-            return battle
-
-        battle_repo.create.side_effect = create_battle_mock
-
-        # Execute
-        battles = await battle_service.generate_preselection_battles(category_id)
-
-        # Verify: 2 battles (one 1v1, one 3-way)
-        assert len(battles) == 2
-
-        # One should be 1v1, one should be 3-way
-        battle_sizes = sorted([len(b.performers) for b in battles])
-        assert battle_sizes == [2, 3]
-
-        # Verify all performers included
-        all_battle_performers = []
-        for battle in battles:
-            all_battle_performers.extend(battle.performers)
-        assert len(all_battle_performers) == 5
-        assert set(all_battle_performers) == set(performers)
-
-    async def test_three_performers_only(
-        self, battle_service, performer_repo, battle_repo, tournament_id, category_id
-    ):
-        """Test preselection with exactly 3 performers."""
-        # Setup: 3 performers
-        performers = [
-            create_performer(tournament_id, category_id, f"Performer{i}")
-            for i in range(3)
-        ]
-        performer_repo.get_regular_performers.return_value = performers
-        performer_repo.get_by_category.return_value = performers
-
-        def create_battle_mock(battle):
-            battle.id = uuid.uuid4()
-            return battle
-
-        battle_repo.create.side_effect = create_battle_mock
-
-        # Execute
-        battles = await battle_service.generate_preselection_battles(category_id)
-
-        # Verify: 1 three-way battle
-        assert len(battles) == 1
-        assert len(battles[0].performers) == 3
-
     async def test_no_performers_raises_error(
         self, battle_service, performer_repo, category_id
     ):
@@ -212,46 +174,35 @@ class TestGeneratePoolBattles:
     ):
         """Test round-robin pool battle generation."""
         # Setup: Pool with 4 performers
-        performers = [
-            create_performer(tournament_id, category_id, f"Performer{i}")
-            for i in range(4)
-        ]
+        performers = create_performers(tournament_id, category_id, 4)
         pool = Pool(category_id=category_id, name="Pool A")
         pool.id = pool_id
         pool.performers = performers
         pool.category_id = category_id
 
-        performer_repo.get_pool_with_performers = AsyncMock(return_value=pool)
-
-        def create_battle_mock(battle):
-            battle.id = uuid.uuid4()
-            return battle
+        performer_repo.get_pool_with_performers.return_value = pool
 
-        battle_repo.create.side_effect = create_battle_mock
+        battle_repo.create.side_effect = assign_battle_id
 
         # Execute
         battles = await battle_service.generate_pool_battles(pool_id)
 
         # Verify: 6 battles (4 choose 2 = 6 combinations)
         assert len(battles) == 6
-        assert all(len(b.performers) == 2 for b in battles)
-        assert all(b.phase == BattlePhase.POOLS for b in battles)
-        assert all(b.status == BattleStatus.PENDING for b in battles)
-        assert all(b.outcome_type == BattleOutcomeType.WIN_DRAW_LOSS for b in battles)
-
-        # Verify all unique pairings exist
-        pairings = set()
-        for battle in battles:
-            p1, p2 = battle.performers
-            pairing = tuple(sorted([p1.id, p2.id]))
-            assert pairing not in pairings, "Duplicate pairing found"
-            pairings.add(pairing)
+        assert {len(b.performers) for b in battles} == {2}
+        assert {b.phase for b in battles} == {BattlePhase.POOLS}
+        assert {b.status for b in battles} == {BattleStatus.PENDING}
+        assert {b.outcome_type for b in battles} == {BattleOutcomeType.WIN_DRAW_LOSS}
+
+        # Verify all unique pairings exist (no duplicates among the 6 battles)
+        pairings = {tuple(sorted(p.id for p in b.performers)) for b in battles}
+        assert len(pairings) == 6, "Duplicate pairing found"
 
     async def test_pool_not_found_raises_error(
         self, battle_service, performer_repo, pool_id
     ):
         """Test that missing pool raises ValidationError."""
-        performer_repo.get_pool_with_performers = AsyncMock(return_value=None)
+        performer_repo.get_pool_with_performers.return_value = None
 
         with pytest.raises(ValidationError, match="Pool .* not found"):
             await battle_service.generate_pool_battles(pool_id)
@@ -263,7 +214,7 @@ class TestGeneratePoolBattles:
         pool = Pool(category_id=category_id, name="Pool A")
         pool.id = pool_id
         pool.performers = []
-        performer_repo.get_pool_with_performers = AsyncMock(return_value=pool)
+        performer_repo.get_pool_with_performers.return_value = pool
 
         with pytest.raises(ValidationError, match="has no performers"):
             await battle_service.generate_pool_battles(pool_id)
@@ -277,17 +228,10 @@ class TestGenerateFinalsBattles:
     ):
         """Test finals battle generation with pool winners."""
         # Setup: 3 pool winners
-        winners = [
-            create_performer(tournament_id, category_id, f"Winner{i}")
-            for i in range(3)
-        ]
-        performer_repo.get_pool_winners = AsyncMock(return_value=winners)
+        winners = create_performers(tournament_id, category_id, 3)
+        performer_repo.get_pool_winners.return_value = winners
 
-        def create_battle_mock(battle):
-            battle.id = uuid.uuid4()
-            return battle
-
-        battle_repo.create.side_effect = create_battle_mock
+        battle_repo.create.side_effect = assign_battle_id
 
         # Execute
         battles = await battle_service.generate_finals_battles(category_id)
@@ -304,7 +248,7 @@ class TestGenerateFinalsBattles:
         self, battle_service, performer_repo, category_id
     ):
         """Test that no pool winners raises ValidationError."""
-        performer_repo.get_pool_winners = AsyncMock(return_value=[])
+        performer_repo.get_pool_winners.return_value = []
 
         with pytest.raises(ValidationError, match="no pool winners"):
             await battle_service.generate_finals_battles(category_id)
@@ -314,7 +258,7 @@ class TestGenerateFinalsBattles:
     ):
         """Test that only one winner raises ValidationError."""
         winner = [create_performer(tournament_id, category_id, "Winner1")]
-        performer_repo.get_pool_winners = AsyncMock(return_value=winner)
+        performer_repo.get_pool_winners.return_value = winner
 
         with pytest.raises(ValidationError, match="need at least 2 pool winners"):
             await battle_service.generate_finals_battles(category_id)
@@ -327,7 +271,7 @@ class TestStartBattle:
         self, battle_service, battle_repo, category_id
     ):
         """Test successfully starting a pending battle."""
-        battle_id = uuid.uuid4()
+        battle_id = _uid()
         battle = create_battle(
             category_id,
             BattlePhase.PRESELECTION,
@@ -339,11 +283,7 @@ class TestStartBattle:
         battle_repo.get_by_id.return_value = battle
         battle_repo.get_active_battle.return_value = None  # No active battle
 
-        def update_mock(battle_id, **kwargs):
-            battle.status = kwargs.get('status', battle.status)
-            return battle
-
-        battle_repo.update.side_effect = update_mock
+        battle_repo.update.side_effect = apply_status_update(battle)
 
         # Execute
         result = await battle_service.start_battle(battle_id)
@@ -354,7 +294,7 @@ class TestStartBattle:
 
     async def test_start_battle_not_found(self, battle_service, battle_repo):
         """Test starting non-existent battle raises error."""
-        battle_id = uuid.uuid4()
+        battle_id = _uid()
         battle_repo.get_by_id.return_value = None
 
         with pytest.raises(ValidationError, match="Battle .* not found"):
@@ -364,7 +304,7 @@ class TestStartBattle:
         self, battle_service, battle_repo, category_id
     ):
         """Test starting non-pending battle raises error."""
-        battle_id = uuid.uuid4()
+        battle_id = _uid()
         battle = create_battle(
             category_id,
             BattlePhase.PRESELECTION,
@@ -382,7 +322,7 @@ class TestStartBattle:
         self, battle_service, battle_repo, category_id
     ):
         """Test starting battle when another is active raises error."""
-        battle_id = uuid.uuid4()
+        battle_id = _uid()
         battle = create_battle(
             category_id,
             BattlePhase.PRESELECTION,
@@ -391,7 +331,7 @@ class TestStartBattle:
         )
         battle.id = battle_id
 
-        other_battle_id = uuid.uuid4()
+        other_battle_id = _uid()
         active_battle = create_battle(
             category_id,
             BattlePhase.PRESELECTION,
@@ -414,7 +354,7 @@ class TestCompleteBattle:
         self, battle_service, battle_repo, category_id
     ):
         """Test successfully completing an active battle."""
-        battle_id = uuid.uuid4()
+        battle_id = _uid()
         battle = create_battle(
             category_id,
             BattlePhase.PRESELECTION,
@@ -422,15 +362,11 @@ class TestCompleteBattle:
             BattleOutcomeType.SCORED,
         )
         battle.id = battle_id
-        battle.outcome = {"winner_id": str(uuid.uuid4())}  # Has outcome
+        battle.outcome = {"winner_id": str(_uid())}  # Has outcome
 
         battle_repo.get_by_id.return_value = battle
 
-        def update_mock(battle_id, **kwargs):
-            battle.status = kwargs.get('status', battle.status)
-            return battle
-
-        battle_repo.update.side_effect = update_mock
+        battle_repo.update.side_effect = apply_status_update(battle)
 
         # Execute
         result = await battle_service.complete_battle(battle_id)
@@ -439,49 +375,35 @@ class TestCompleteBattle:
         assert result.status == BattleStatus.COMPLETED
         battle_repo.update.assert_called_once()
 
-    async def test_complete_battle_not_found(self, battle_service, battle_repo):
-        """Test completing non-existent battle raises error."""
-        battle_id = uuid.uuid4()
-        battle_repo.get_by_id.return_value = None
-
-        with pytest.raises(ValidationError, match="Battle .* not found"):
-            await battle_service.complete_battle(battle_id)
-
-    async def test_complete_battle_not_active(
-        self, battle_service, battle_repo, category_id
-    ):
-        """Test completing non-active battle raises error."""
-        battle_id = uuid.uuid4()
-        battle = create_battle(
-            category_id,
-            BattlePhase.PRESELECTION,
-            BattleStatus.PENDING,  # Not active
-            BattleOutcomeType.SCORED,
-        )
-        battle.id = battle_id
-
-        battle_repo.get_by_id.return_value = battle
-
-        with pytest.raises(ValidationError, match="must be ACTIVE"):
-            await battle_service.complete_battle(battle_id)
-
-    async def test_complete_battle_no_outcome(
-        self, battle_service, battle_repo, category_id
-    ):
-        """Test completing battle without outcome raises error."""
-        battle_id = uuid.uuid4()
-        battle = create_battle(
-            category_id,
-            BattlePhase.PRESELECTION,
-            BattleStatus.ACTIVE,
-            BattleOutcomeType.SCORED,
-        )
-        battle.id = battle_id
-        battle.outcome = None  # No outcome
+    @pytest.mark.parametrize(
+        "status,expected_error",
+        [
+            (None, "Battle .* not found"),  # Battle does not exist
+            (BattleStatus.PENDING, "must be ACTIVE"),  # Not active
+            (BattleStatus.ACTIVE, "outcome data is missing"),  # No outcome
+        ],
+        ids=["not_found", "not_active", "no_outcome"],
+    )
+    async def test_complete_battle_errors(
+        self, battle_service, battle_repo, category_id, status, expected_error
+    ):
+        """Test completing a missing, non-active or unscored battle raises error."""
+        battle_id = _uid()
+        if status is None:
+            battle = None
+        else:
+            battle = create_battle(
+                category_id,
+                BattlePhase.PRESELECTION,
+                status,
+                BattleOutcomeType.SCORED,
+            )
+            battle.id = battle_id
+            battle.outcome = None  # No outcome
 
         battle_repo.get_by_id.return_value = battle
 
-        with pytest.raises(ValidationError, match="outcome data is missing"):
+        with pytest.raises(ValidationError, match=expected_error):
             await battle_service.complete_battle(battle_id)
 
 
@@ -502,7 +424,7 @@ class TestGetNextPendingBattle:
             for _ in range(3)
         ]
 
-        battle_repo.get_by_tournament_and_status = AsyncMock(return_value=battles)
+        battle_repo.get_by_tournament_and_status.return_value = battles
 
         # Execute
         result = await battle_service.get_next_pending_battle(tournament_id)
@@ -517,7 +439,7 @@ class TestGetNextPendingBattle:
         self, battle_service, battle_repo, tournament_id
     ):
         """Test getting next pending battle when none exist."""
-        battle_repo.get_by_tournament_and_status = AsyncMock(return_value=[])
+        battle_repo.get_by_tournament_and_status.return_value = []
 
         result = await battle_service.get_next_pending_battle(tournament_id)
 
@@ -527,18 +449,21 @@ class TestGetNextPendingBattle:
 class TestGetActiveBattle:
     """Tests for getting active battle."""
 
-    async def test_get_active_battle_with_tournament_id(
-        self, battle_service, battle_repo, tournament_id, category_id
-    ):
-        """Test getting active battle filtered by tournament."""
-        active_battle = create_battle(
+    @pytest.fixture(scope="class")
+    def active_battle(self, category_id):
+        """ACTIVE preselection battle; read-only, so shared by the class."""
+        return create_battle(
             category_id,
             BattlePhase.PRESELECTION,
             BattleStatus.ACTIVE,
             BattleOutcomeType.SCORED,
         )
 
-        battle_repo.get_by_tournament_and_status = AsyncMock(return_value=[active_battle])
+    async def test_get_active_battle_with_tournament_id(
+        self, battle_service, battle_repo, tournament_id, active_battle
+    ):
+        """Test getting active battle filtered by tournament."""
+        battle_repo.get_by_tournament_and_status.return_value = [active_battle]
 
         # Execute
         result = await battle_service.get_active_battle(tournament_id)
@@ -550,16 +475,9 @@ class TestGetActiveBattle:
         )
 
     async def test_get_active_battle_without_tournament_id(
-        self, battle_service, battle_repo, category_id
+        self, battle_service, battle_repo, active_battle
     ):
         """Test getting active battle without tournament filter."""
-        active_battle = create_battle(
-            category_id,
-            BattlePhase.PRESELECTION,
-            BattleStatus.ACTIVE,
-            BattleOutcomeType.SCORED,
-        )
-
         battle_repo.get_active_battle.return_value = active_battle
 
         # Execute
@@ -614,28 +532,33 @@ class TestGetBattleQueue:
         ]
 
         all_battles = pending_battles + [active_battle] + completed_battles
-        battle_repo.get_by_tournament = AsyncMock(return_value=all_battles)
+        battle_repo.get_by_tournament.return_value = all_battles
 
         # Execute
         queue = await battle_service.get_battle_queue(tournament_id)
 
         # Verify
-        assert len(queue[BattleStatus.PENDING]) == 3
-        assert len(queue[BattleStatus.ACTIVE]) == 1
-        assert len(queue[BattleStatus.COMPLETED]) == 2
+        counts = (
+            len(queue[BattleStatus.PENDING]),
+            len(queue[BattleStatus.ACTIVE]),
+            len(queue[BattleStatus.COMPLETED]),
+        )
+        assert counts == (3, 1, 2)
         assert queue[BattleStatus.ACTIVE][0] == active_battle
 
     async def test_get_battle_queue_empty(
         self, battle_service, battle_repo, tournament_id
     ):
         """Test getting empty battle queue."""
-        battle_repo.get_by_tournament = AsyncMock(return_value=[])
+        battle_repo.get_by_tournament.return_value = []
 
         queue = await battle_service.get_battle_queue(tournament_id)
 
-        assert queue[BattleStatus.PENDING] == []
-        assert queue[BattleStatus.ACTIVE] == []
-        assert queue[BattleStatus.COMPLETED] == []
+        assert (
+            queue[BattleStatus.PENDING],
+            queue[BattleStatus.ACTIVE],
+            queue[BattleStatus.COMPLETED],
+        ) == ([], [], [])
 
 
 def create_category(
@@ -649,7 +572,7 @@ def create_category(
         groups_ideal=2,
         performers_ideal=4,
     )
-    category.id = uuid.uuid4()
+    category.id = _uid()
     return category
 
 
@@ -671,8 +594,8 @@ class TestGenerateInterleavedPreselectionBattles:
         cat_k = create_category(tournament_id, "K-pop")
 
         # Setup performers
-        h_performers = [create_performer(tournament_id, cat_h.id) for _ in range(4)]
-        k_performers = [create_performer(tournament_id, cat_k.id) for _ in range(6)]
+        h_performers = create_performers(tournament_id, cat_h.id, 4)
+        k_performers = create_performers(tournament_id, cat_k.id, 6)
 
         def get_performers_by_cat(cat_id):
             if cat_id == cat_h.id:
@@ -689,12 +612,11 @@ class TestGenerateInterleavedPreselectionBattles:
         created_battles = []
 
         def create_battle_mock(battle):
-            battle.id = uuid.uuid4()
+            battle.id = _uid()
             created_battles.append(battle)
             return battle
 
         battle_repo.create.side_effect = create_battle_mock
-        battle_repo.update = AsyncMock()
 
         with patch(
             "app.repositories.category.CategoryRepository",
@@ -724,7 +646,7 @@ class TestGenerateInterleavedPreselectionBattles:
     ):
         """Test sequence_order field assigned correctly."""
         category = create_category(tournament_id, "Test")
-        performers = [create_performer(tournament_id, category.id) for _ in range(6)]
+        performers = create_performers(tournament_id, category.id, 6)
 
         performer_repo.get_by_category.return_value = performers
         performer_repo.get_regular_performers.return_value = performers
@@ -735,12 +657,11 @@ class TestGenerateInterleavedPreselectionBattles:
         battle_ids = []
 
         def create_battle_mock(battle):
-            battle.id = uuid.uuid4()
+            battle.id = _uid()
             battle_ids.append(battle.id)
             return battle
 
         battle_repo.create.side_effect = create_battle_mock
-        battle_repo.update = AsyncMock()
 
         with patch(
             "app.repositories.category.CategoryRepository",
@@ -759,7 +680,7 @@ class TestGenerateInterleavedPreselectionBattles:
     ):
         """Test works with single category."""
         category = create_category(tournament_id, "Solo")
-        performers = [create_performer(tournament_id, category.id) for _ in range(6)]
+        performers = create_performers(tournament_id, category.id, 6)
 
         performer_repo.get_by_category.return_value = performers
         performer_repo.get_regular_performers.return_value = performers
@@ -767,12 +688,7 @@ class TestGenerateInterleavedPreselectionBattles:
         mock_category_repo = AsyncMock(spec=CategoryRepository)
         mock_category_repo.get_by_tournament.return_value = [category]
 
-        def create_battle_mock(battle):
-            battle.id = uuid.uuid4()
-            return battle
-
-        battle_repo.create.side_effect = create_battle_mock
-        battle_repo.update = AsyncMock()
+        battle_repo.create.side_effect = assign_battle_id
 
         with patch(
             "app.repositories.category.CategoryRepository",
@@ -834,8 +750,8 @@ class TestGenerateInterleavedPreselectionBattles:
         cat_a = create_category(tournament_id, "Small")
         cat_b = create_category(tournament_id, "Large")
 
-        a_performers = [create_performer(tournament_id, cat_a.id) for _ in range(2)]
-        b_performers = [create_performer(tournament_id, cat_b.id) for _ in range(10)]
+        a_performers = create_performers(tournament_id, cat_a.id, 2)
+        b_performers = create_performers(tournament_id, cat_b.id, 10)
 
         def get_performers_by_cat(cat_id):
             if cat_id == cat_a.id:
@@ -848,12 +764,7 @@ class TestGenerateInterleavedPreselectionBattles:
         mock_category_repo = AsyncMock(spec=CategoryRepository)
         mock_category_repo.get_by_tournament.return_value = [cat_a, cat_b]
 
-        def create_battle_mock(battle):
-            battle.id = uuid.uuid4()
-            return battle
-
-        battle_repo.create.side_effect = create_battle_mock
-        battle_repo.update = AsyncMock()
+        battle_repo.create.side_effect = assign_battle_id
 
         with patch(
             "app.repositories.category.CategoryRepository",
@@ -895,7 +806,6 @@ class TestReorderBattle:
 
         battle_repo.get_by_id.return_value = target_battle
         battle_repo.get_pending_battles_ordered.return_value = battles
-        battle_repo.update_sequence_order = AsyncMock()
 
         # Move battle #3 to position #5
         result = await battle_service.reorder_battle(target_battle.id, 5)
@@ -998,7 +908,7 @@ class TestReorderBattle:
         battle_repo.get_by_id.return_value = None
 
         with pytest.raises(ValidationError, match="not found"):
-            await battle_service.reorder_battle(uuid.uuid4(), 2)
+            await battle_service.reorder_battle(_uid(), 2)
 
     async def test_position_clamped_to_max(
         self, battle_service, battle_repo, category_id
@@ -1021,7 +931,6 @@ class TestReorderBattle:
 
         battle_repo.get_by_id.return_value = target_battle
         battle_repo.get_pending_battles_ordered.return_value = battles
-        battle_repo.update_sequence_order = AsyncMock()
 
         # Try to move to position 10 (only 5 exist)
         result = await battle_service.reorder_battle(target_battle.id, 10)
@@ -1050,7 +959,6 @@ class TestReorderBattle:
 
         battle_repo.get_by_id.return_value = target_battle
         battle_repo.get_pending_battles_ordered.return_value = battles
-        battle_repo.update_sequence_order = AsyncMock()
 
         await battle_service.reorder_battle(target_battle.id, 3)
 
@@ -1,4 +1,6 @@
 """Integration tests for CRUD workflows."""
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
@@ -6,7 +8,7 @@ from app.auth import magic_link_auth
 from app.config import settings
 from app.db.database import get_db
 # Use isolated test database - NEVER import from app.db.database!
-from tests.conftest import test_session_maker
+from tests.conftest import session_cookie, test_session_maker
 from app.repositories.user import UserRepository
 from app.repositories.dancer import DancerRepository
 from app.repositories.tournament import TournamentRepository
@@ -15,36 +17,9 @@ from app.repositories.performer import PerformerRepository
 from app.models.user import UserRole
 from app.models.tournament import TournamentStatus, TournamentPhase
 from app.services.email.service import EmailService
-from app.services.email.provider import BaseEmailProvider
 from app.dependencies import get_email_service
 
 
-class MockEmailProvider(BaseEmailProvider):
-    """Mock email provider for testing."""
-
-    def __init__(self):
-        self.sent_emails = []
-
-    async def send_magic_link(
-        self, to_email: str, magic_link: str, first_name: str
-    ) -> bool:
-        """Mock email sending - just store the email data."""
-        self.sent_emails.append(
-            {"to_email": to_email, "magic_link": magic_link, "first_name": first_name}
-        )
-        return True
-
-    def clear(self):
-        """Clear sent emails list."""
-        self.sent_emails = []
-
-
-@pytest.fixture
-def mock_email_provider():
-    """Create mock email provider for testing."""
-    return MockEmailProvider()
-
-
 @pytest.fixture(scope="function", autouse=True)
 async def setup_test_users():
     """Create test users for CRUD tests."""
@@ -93,12 +68,7 @@ def get_session_cookie(client, email, role):
     """Helper to login and extract session cookie."""
     token = magic_link_auth.generate_token(email, role)
     response = client.get(f"/auth/verify?token={token}", follow_redirects=False)
-
-    # Extract session cookie from Set-Cookie header
-    set_cookie_header = response.headers.get("set-cookie", "")
-    cookie_start = set_cookie_header.find(f"{settings.SESSION_COOKIE_NAME}=") + len(f"{settings.SESSION_COOKIE_NAME}=")
-    cookie_end = set_cookie_header.find(";", cookie_start)
-    return set_cookie_header[cookie_start:cookie_end]
+    return session_cookie(response)
 
 
 class TestUserManagementCRUD:
@@ -146,8 +116,6 @@ class TestUserManagementCRUD:
                 user = await user_repo.get_by_email("staff@test.com")
                 return str(user.id)
 
-        import asyncio
-
         user_id = asyncio.run(get_user_id())
 
         # Update user
@@ -185,8 +153,6 @@ class TestUserManagementCRUD:
                 user = await user_repo.get_by_email("todelete@test.com")
                 return str(user.id) if user else None
 
-        import asyncio
-
         user_id = asyncio.run(get_user_id())
         if not user_id:
             pytest.skip("User creation failed")
@@ -249,8 +215,6 @@ class TestTournamentCRUD:
                 tournaments = await tournament_repo.get_all()
                 return str(tournaments[0].id) if tournaments else None
 
-        import asyncio
-
         tournament_id = asyncio.run(get_tournament_id())
         if not tournament_id:
             pytest.skip("Tournament creation failed")
@@ -288,8 +252,6 @@ class TestTournamentCRUD:
                 tournaments = await tournament_repo.get_all()
                 return str(tournaments[0].id) if tournaments else None
 
-        import asyncio
-
         tournament_id = asyncio.run(get_tournament_id())
         if not tournament_id:
             pytest.skip("Tournament creation failed")
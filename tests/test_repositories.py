@@ -206,6 +206,51 @@ async def test_performer_repository():
         assert len(performers) == 1
 
 
+@pytest.mark.asyncio
+async def test_performer_repository_bulk_update():
+    """Test PerformerRepository.bulk_update updates several performers at once."""
+    async with test_session_maker() as session:
+        tournament_repo = TournamentRepository(session)
+        category_repo = CategoryRepository(session)
+        dancer_repo = DancerRepository(session)
+        performer_repo = PerformerRepository(session)
+
+        tournament = await tournament_repo.create_tournament("Test")
+        category = await category_repo.create_category(
+            tournament_id=tournament.id,
+            name="Test Category",
+        )
+
+        performers = []
+        for i in range(2):
+            dancer = await dancer_repo.create_dancer(
+                email=f"dancer{i}@test.com",
+                first_name="Test",
+                last_name="Dancer",
+                date_of_birth=date(2000, 1, 1),
+                blaze=f"Blaze{i}",
+            )
+            performers.append(await performer_repo.create_performer(
+                tournament_id=tournament.id,
+                category_id=category.id,
+                dancer_id=dancer.id,
+            ))
+
+        updated = await performer_repo.bulk_update({
+            performers[0].id: {"pool_wins": 1},
+            performers[1].id: {"pool_losses": 1},
+        })
+
+        assert len(updated) == 2
+        winner = await performer_repo.get_by_id(performers[0].id)
+        loser = await performer_repo.get_by_id(performers[1].id)
+        assert winner.pool_wins == 1
+        assert loser.pool_losses == 1
+
+        # Empty mapping is a no-op
+        assert await performer_repo.bulk_update({}) == []
+
+
 @pytest.mark.asyncio
 async def test_performer_repository_unique_constraint():
     """Test that dancer can only register once per tournament."""